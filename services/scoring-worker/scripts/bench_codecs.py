@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark message and log serialization: the previous stdlib path against the
+worker's codecs (orjson / msgpack when installed).
+
+Run from the repo root with the worker's dependencies installed:
+  python services/scoring-worker/scripts/bench_codecs.py [iterations]
+"""
+
+import json
+import logging
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pythonjsonlogger import jsonlogger  # noqa: E402
+
+import worker  # noqa: E402
+
+REQUEST = {"request_id": "req-0b7d1c9e", "scoring_job_id": "8f14e45f-ceea-467f-a0e6-0c5b3a1d2e4f"}
+RESPONSE = {
+    "request_id": "req-0b7d1c9e",
+    "status": "success",
+    "value": "PASS",
+    "explanation": "The agent verified the caller's identity before discussing the account. " * 8,
+    "cost": {
+        "prompt_tokens": Decimal("2015"),
+        "completion_tokens": Decimal("2"),
+        "total_tokens": Decimal("2017"),
+        "llm_calls": Decimal("2"),
+        "cached_tokens": Decimal("0"),
+        "input_cost": Decimal("0.00030225"),
+        "output_cost": Decimal("0.0000012"),
+        "total_cost": Decimal("0.00030345"),
+    },
+    "cached": False,
+}
+
+
+def _legacy_json_safe(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _legacy_json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_legacy_json_safe(v) for v in value]
+    return value
+
+
+def _log_record():
+    record = logging.LogRecord("root", logging.INFO, __file__, 1, "Job prepared", None, None)
+    record.request_id = REQUEST["request_id"]
+    record.scoring_job_id = REQUEST["scoring_job_id"]
+    record.prepare_seconds = 0.4123
+    record.stage_seconds = {"item": 0.1021, "text": 0.0003, "metadata": 0.2011, "score_id": 0.0412}
+    return record
+
+
+def _formatter(**kwargs):
+    return jsonlogger.JsonFormatter(
+        fmt='%(asctime)s %(levelname)s %(name)s %(message)s',
+        rename_fields={'asctime': 'timestamp', 'levelname': 'level', 'name': 'logger'},
+        **kwargs,
+    )
+
+
+def _report(label: str, fn, iterations: int, baseline: float = None) -> float:
+    seconds = min(timeit.repeat(fn, number=iterations, repeat=5))
+    per_call = seconds / iterations * 1e6
+    speedup = f"  {baseline / per_call:5.2f}x" if baseline else ""
+    print(f"  {label:<34} {per_call:8.2f} µs{speedup}")
+    return per_call
+
+
+def main() -> int:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    codecs = {worker.JSON_CODEC.name: worker.JSON_CODEC}
+    if "application/msgpack" in worker.CODECS:
+        codecs["msgpack"] = worker.CODECS["application/msgpack"]
+    print(f"iterations={iterations} codecs={', '.join(codecs)}")
+
+    print("decode request")
+    body = json.dumps(REQUEST).encode()
+    baseline = _report("json.loads(body.decode())", lambda: json.loads(body.decode()), iterations)
+    for name, codec in codecs.items():
+        encoded = codec.encode(REQUEST)
+        _report(f"{name}.decode(body)", lambda c=codec, b=encoded: c.decode(b), iterations, baseline)
+
+    print("encode response")
+    baseline = _report(
+        "json.dumps(_json_safe(r)).encode()",
+        lambda: json.dumps(_legacy_json_safe(RESPONSE)).encode(),
+        iterations,
+    )
+    for name, codec in codecs.items():
+        _report(f"{name}.encode(r)", lambda c=codec: c.encode(RESPONSE), iterations, baseline)
+
+    print("format log record")
+    record = _log_record()
+    stdlib = _formatter()
+    baseline = _report("JsonFormatter (json.dumps)", lambda: stdlib.format(record), iterations)
+    fast = _formatter(json_default=jsonlogger.JsonEncoder().default, json_serializer=worker._log_serializer)
+    _report(f"JsonFormatter ({worker.JSON_CODEC.name})", lambda: fast.format(record), iterations, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark item metadata decoding: eager json.loads of every string value (the
+previous _fetch_item_data behaviour) against LazyJSONDict, for metadata with a few
+small fields and JSON blobs of increasing size.
+
+Run from the repo root with the worker's dependencies installed:
+  python services/scoring-worker/scripts/bench_metadata.py
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import worker  # noqa: E402
+
+BLOB_SIZES = (10_000, 100_000, 1_000_000, 5_000_000)
+
+
+def _metadata(blob_bytes: int) -> dict:
+    """Call-center style metadata: small scalar fields plus two JSON-encoded blobs."""
+    segment = {
+        "speaker": "agent",
+        "start": 12.48,
+        "end": 17.02,
+        "text": "Thank you for calling, can I have the account number please?",
+        "confidence": 0.94,
+    }
+    segments = [segment] * max(1, blob_bytes // len(json.dumps(segment)))
+    return {
+        "call_id": "a1b2c3d4",
+        "agent_id": "agent-0142",
+        "queue": "billing",
+        "duration_seconds": "412",
+        "language": "en-US",
+        "customer_tier": "\"gold\"",
+        "tags": json.dumps(["escalation", "refund"]),
+        "disposition": json.dumps({"code": "RESOLVED", "reason": "refund issued"}),
+        "transcript_segments": json.dumps(segments),
+        "sentiment_timeline": json.dumps([{"t": i, "score": 0.1} for i in range(len(segments))]),
+    }
+
+
+def _eager(metadata: dict) -> dict:
+    metadata = dict(metadata)
+    for key, value in list(metadata.items()):
+        if isinstance(value, str):
+            try:
+                metadata[key] = json.loads(value)
+            except (json.JSONDecodeError, ValueError):
+                pass
+    return metadata
+
+
+def _read_few(metadata):
+    return metadata["queue"], metadata.get("tags"), metadata.get("disposition")
+
+
+def _read_all(metadata):
+    return list(metadata.items())
+
+
+def _time(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1000
+
+
+def main() -> int:
+    print(f"{'blob size':>10}  {'eager':>10}  {'lazy, 3 keys':>14}  {'lazy, all keys':>15}")
+    for size in BLOB_SIZES:
+        raw = _metadata(size)
+        number = max(1, 2_000_000 // size)
+        eager = _time(lambda: _read_few(_eager(raw)), number)
+        lazy_few = _time(lambda: _read_few(worker.LazyJSONDict(raw)), number)
+        lazy_all = _time(lambda: _read_all(worker.LazyJSONDict(raw)), number)
+        print(f"{size:>10,}  {eager:>8.3f}ms  {lazy_few:>12.3f}ms  {lazy_all:>13.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -77,6 +77,25 @@ class TestWorkerStartsInGenericContainerRuntime:
             resp = requests.get(f"http://{host}:{port}/healthz", timeout=5)
             assert resp.status_code == 200
 
+    def test_stats_endpoint_reports_caches(self, rabbitmq_network):
+        """Stats endpoint exposes the scorecard and lookup cache counters.
+
+        Mock mode never touches the caches, so this checks the shape of the report only.
+        """
+        with container_with_env(REQUIRED_ENV, rabbitmq_network) as container:
+            wait_for_worker_ready(container)
+            host = container.get_container_host_ip()
+            port = container.get_exposed_port(8080)
+            resp = requests.get(f"http://{host}:{port}/stats", timeout=5)
+            assert resp.status_code == 200
+            stats = resp.json()
+            assert set(stats["scorecard_cache"]) == {"hits", "misses", "evictions", "expirations", "size", "keys"}
+            assert set(stats["lookup_cache"]) == {
+                "hits", "negative_hits", "misses", "coalesced", "errors", "size", "pending"
+            }
+            for section in ("scorecard_cache", "lookup_cache"):
+                assert all(isinstance(value, int) for value in stats[section].values())
+
 
 class TestWorkerFailsFastOnMissingConfiguration:
     """
@@ -3,6 +3,7 @@ RabbitMQ integration tests for the scoring worker.
 """
 
 import json
+import threading
 import time
 
 import pika
@@ -22,6 +23,19 @@ def _connect_pika(rabbit):
     return pika.BlockingConnection(params)
 
 
+def _unacked_count(rabbit, queue_name):
+    """Broker-side count of delivered but unacknowledged messages on queue_name."""
+    exit_code, output = rabbit.get_wrapped_container().exec_run(
+        "rabbitmqctl list_queues --quiet --no-table-headers name messages_unacknowledged"
+    )
+    assert exit_code == 0, output
+    for line in output.decode().splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] == queue_name:
+            return int(parts[1])
+    return 0
+
+
 def _get_message(channel, queue_name, timeout=10):
     end = time.time() + timeout
     while time.time() < end:
@@ -61,6 +75,7 @@ def test_worker_consumes_request_and_publishes_result(rabbitmq_setup):
         assert response["value"] == "mock"
         assert "mock scoring for job-1" in response["explanation"]
         assert response["cost"] is None
+        assert response["cached"] is False
 
         # Ensure request queue is empty after ack
         method, properties, body = channel.basic_get(
@@ -71,6 +86,289 @@ def test_worker_consumes_request_and_publishes_result(rabbitmq_setup):
         connection.close()
 
 
+def test_metrics_count_processed_messages(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    with container_with_env(REQUIRED_ENV, network) as container:
+        wait_for_worker_ready(container)
+        host = container.get_container_host_ip()
+        port = container.get_exposed_port(8080)
+
+        connection = _connect_pika(rabbit)
+        channel = connection.channel()
+        channel.queue_declare(queue=REQUIRED_ENV["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True)
+        channel.queue_declare(queue=REQUIRED_ENV["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+
+        request = {"request_id": "req-metrics", "scoring_job_id": "job-metrics"}
+        channel.basic_publish(
+            exchange="",
+            routing_key=REQUIRED_ENV["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps(request).encode(),
+        )
+        response = _get_message(channel, REQUIRED_ENV["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=15)
+        assert response is not None, "Expected a response message"
+
+        metrics = requests.get(f"http://{host}:{port}/metrics", timeout=5)
+        assert metrics.status_code == 200
+        assert metrics.headers["Content-Type"].startswith("text/plain")
+        assert 'scoring_worker_messages_total{outcome="success"} 1.0' in metrics.text
+        assert "scoring_worker_job_duration_seconds_count 1" in metrics.text
+        assert "scoring_worker_in_flight_jobs" in metrics.text
+
+        connection.close()
+
+
+def test_batch_request_publishes_combined_response(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    with container_with_env(REQUIRED_ENV, network) as container:
+        wait_for_worker_ready(container)
+
+        connection = _connect_pika(rabbit)
+        channel = connection.channel()
+        channel.queue_declare(queue=REQUIRED_ENV["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True)
+        channel.queue_declare(queue=REQUIRED_ENV["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+
+        request = {"request_id": "req-batch", "scoring_job_ids": ["job-a", "job-b", "job-c"]}
+        channel.basic_publish(
+            exchange="",
+            routing_key=REQUIRED_ENV["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps(request).encode(),
+        )
+
+        response = _get_message(channel, REQUIRED_ENV["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=15)
+        assert response is not None, "Expected a response message"
+        assert response["request_id"] == "req-batch"
+        assert response["status"] == "success"
+        assert [r["scoring_job_id"] for r in response["results"]] == ["job-a", "job-b", "job-c"]
+        assert all(r["status"] == "success" and r["value"] == "mock" for r in response["results"])
+
+        connection.close()
+
+
+def test_priority_requests_are_processed_first(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    env = {
+        **REQUIRED_ENV,
+        "PLEXUS_RABBITMQ_REQUEST_QUEUE": "scoring-requests-priority",
+        "PLEXUS_RABBITMQ_RESPONSE_QUEUE": "scoring-responses-priority",
+        "PLEXUS_RABBITMQ_MAX_PRIORITY": "10",
+    }
+
+    connection = _connect_pika(rabbit)
+    channel = connection.channel()
+    channel.queue_declare(
+        queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True, arguments={"x-max-priority": 10}
+    )
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+
+    # Queue a backlog of batch requests, then one interactive request, before the worker starts.
+    for i in range(5):
+        channel.basic_publish(
+            exchange="",
+            routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps({"request_id": f"req-batch-{i}", "scoring_job_id": f"job-batch-{i}"}).encode(),
+            properties=pika.BasicProperties(priority=0),
+        )
+    channel.basic_publish(
+        exchange="",
+        routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+        body=json.dumps({"request_id": "req-interactive", "scoring_job_id": "job-interactive"}).encode(),
+        properties=pika.BasicProperties(priority=9),
+    )
+
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+        response = _get_message(channel, env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=15)
+        assert response is not None, "Expected a response message"
+        assert response["request_id"] == "req-interactive"
+
+    connection.close()
+
+
+def test_adaptive_prefetch_raises_broker_side_concurrency(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    env = {
+        **REQUIRED_ENV,
+        "PLEXUS_RABBITMQ_REQUEST_QUEUE": "scoring-requests-adaptive",
+        "PLEXUS_RABBITMQ_RESPONSE_QUEUE": "scoring-responses-adaptive",
+        "PLEXUS_RABBITMQ_PREFETCH_MODE": "adaptive",
+        "PLEXUS_RABBITMQ_PREFETCH": "1",
+        "PLEXUS_RABBITMQ_PREFETCH_MAX": "4",
+        "PLEXUS_ADAPTIVE_INTERVAL_SECONDS": "1",
+        "PLEXUS_MOCK_DELAY_MS": "200",
+    }
+
+    connection = _connect_pika(rabbit)
+    channel = connection.channel()
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True)
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+    for i in range(80):
+        channel.basic_publish(
+            exchange="",
+            routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps({"request_id": f"req-adaptive-{i}", "scoring_job_id": f"job-{i}"}).encode(),
+        )
+
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+        host = container.get_container_host_ip()
+        port = container.get_exposed_port(8080)
+
+        # The limit grows by one per saturated interval; the broker must deliver that many.
+        peak_unacked = 0
+        end = time.time() + 15
+        while time.time() < end and peak_unacked < 3:
+            peak_unacked = max(peak_unacked, _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]))
+            time.sleep(0.2)
+        assert peak_unacked >= 3
+
+        metrics = requests.get(f"http://{host}:{port}/metrics", timeout=5)
+        prefetch = [line for line in metrics.text.splitlines() if line.startswith("scoring_worker_prefetch ")]
+        assert prefetch and float(prefetch[0].split()[1]) >= 3
+        assert "Adaptive prefetch changed" in container.get_logs()[0].decode()
+
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"])
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"])
+    connection.close()
+
+
+def test_pipelined_publishing_answers_and_acks_every_request(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    env = {
+        **REQUIRED_ENV,
+        "PLEXUS_RABBITMQ_REQUEST_QUEUE": "scoring-requests-pipelined",
+        "PLEXUS_RABBITMQ_RESPONSE_QUEUE": "scoring-responses-pipelined",
+        "PLEXUS_RABBITMQ_PUBLISH_MODE": "pipelined",
+        "PLEXUS_RABBITMQ_PREFETCH": "8",
+        "PLEXUS_MOCK_DELAY_MS": "20",
+    }
+    request_ids = {f"req-pipelined-{i}" for i in range(30)}
+
+    connection = _connect_pika(rabbit)
+    channel = connection.channel()
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True)
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+        for request_id in sorted(request_ids):
+            channel.basic_publish(
+                exchange="",
+                routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+                body=json.dumps({"request_id": request_id, "scoring_job_id": f"job-{request_id}"}).encode(),
+            )
+
+        received = set()
+        while received != request_ids:
+            response = _get_message(channel, env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=15)
+            assert response is not None, f"Missing responses for {sorted(request_ids - received)}"
+            assert response["status"] == "success"
+            received.add(response["request_id"])
+
+        # Every request is acked once its response is confirmed (acks are coalesced)
+        end = time.time() + 10
+        while time.time() < end and _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]):
+            time.sleep(0.2)
+        assert _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]) == 0
+        queue = channel.queue_declare(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True, passive=True)
+        assert queue.method.message_count == 0
+
+    connection.close()
+
+
+def test_bulkhead_defers_saturated_scorecard_behind_other_work(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    env = {
+        **REQUIRED_ENV,
+        "PLEXUS_RABBITMQ_REQUEST_QUEUE": "scoring-requests-bulkhead",
+        "PLEXUS_RABBITMQ_RESPONSE_QUEUE": "scoring-responses-bulkhead",
+        "PLEXUS_RABBITMQ_PREFETCH": "2",
+        "PLEXUS_BULKHEAD_LIMIT": "1",
+        "PLEXUS_BULKHEAD_HOLD_MS": "100",
+        "PLEXUS_BULKHEAD_REQUEUE_DELAY_MS": "200",
+        "PLEXUS_MOCK_DELAY_MS": "1500",
+    }
+    # Mock job IDs '<scorecard>:<id>' choose the scorecard the bulkhead is keyed by
+    job_ids = ["slow:1", "slow:2", "slow:3", "slow:4", "fast:1"]
+
+    connection = _connect_pika(rabbit)
+    channel = connection.channel()
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True)
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+    for job_id in job_ids:
+        channel.basic_publish(
+            exchange="",
+            routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps({"request_id": job_id, "scoring_job_id": job_id}).encode(),
+        )
+
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+        host = container.get_container_host_ip()
+        port = container.get_exposed_port(8080)
+
+        order = []
+        while len(order) < len(job_ids):
+            response = _get_message(channel, env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=30)
+            assert response is not None, f"Missing responses for {sorted(set(job_ids) - set(order))}"
+            assert response["status"] == "success"
+            order.append(response["request_id"])
+
+        # slow:1 holds the scorecard's only slot; the other slow requests go to the
+        # back of the queue instead of blocking the prefetch slot fast:1 needs
+        assert sorted(order) == sorted(job_ids)
+        assert order.index("fast:1") < order.index("slow:2")
+        metrics = requests.get(f"http://{host}:{port}/metrics", timeout=5)
+        assert 'scoring_worker_messages_total{outcome="requeued"}' in metrics.text
+        end = time.time() + 10
+        while time.time() < end and _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]):
+            time.sleep(0.2)
+        assert _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]) == 0
+
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"])
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"])
+    channel.queue_delete(queue=f"{env['PLEXUS_RABBITMQ_REQUEST_QUEUE']}.deferred")
+    connection.close()
+
+
+def test_batch_completes_when_bulkhead_limit_is_one(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    env = {
+        **REQUIRED_ENV,
+        "PLEXUS_RABBITMQ_REQUEST_QUEUE": "scoring-requests-bulkhead-batch",
+        "PLEXUS_RABBITMQ_RESPONSE_QUEUE": "scoring-responses-bulkhead-batch",
+        "PLEXUS_BULKHEAD_LIMIT": "1",
+        "PLEXUS_MOCK_DELAY_MS": "50",
+    }
+    job_ids = ["job-a", "job-b", "job-c", "job-d"]
+
+    connection = _connect_pika(rabbit)
+    channel = connection.channel()
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True)
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+        channel.basic_publish(
+            exchange="",
+            routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps({"request_id": "req-batch-limit-1", "scoring_job_ids": job_ids}).encode(),
+        )
+
+        # The batch's one slot scores its jobs one at a time instead of deadlocking
+        response = _get_message(channel, env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=15)
+        assert response is not None, "Expected a combined response"
+        assert response["status"] == "success"
+        assert [r["scoring_job_id"] for r in response["results"]] == job_ids
+        end = time.time() + 10
+        while time.time() < end and _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]):
+            time.sleep(0.2)
+        assert _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]) == 0
+
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"])
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"])
+    connection.close()
+
+
 def test_worker_failure_does_not_publish_success(rabbitmq_setup):
     rabbit, network = rabbitmq_setup
     with container_with_env(REQUIRED_ENV, network) as container:
@@ -98,6 +396,119 @@ def test_worker_failure_does_not_publish_success(rabbitmq_setup):
         connection.close()
 
 
+def test_fatal_failure_is_parked_with_reason(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    env = {
+        **REQUIRED_ENV,
+        "PLEXUS_RABBITMQ_REQUEST_QUEUE": "scoring-requests-retry",
+        "PLEXUS_RABBITMQ_RESPONSE_QUEUE": "scoring-responses-retry",
+        "PLEXUS_RETRY_MAX_ATTEMPTS": "2",
+        "PLEXUS_MOCK_FAIL_JOB_IDS": "job-fatal",
+    }
+    parking_queue = f"{env['PLEXUS_RABBITMQ_REQUEST_QUEUE']}.parked"
+
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+
+        connection = _connect_pika(rabbit)
+        channel = connection.channel()
+        channel.basic_publish(
+            exchange="",
+            routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps({"request_id": "req-fatal", "scoring_job_id": "job-fatal"}).encode(),
+        )
+
+        # ValueError is not transient, so the request skips the retry tiers
+        end = time.time() + 15
+        body = None
+        while time.time() < end and body is None:
+            method, properties, body = channel.basic_get(queue=parking_queue, auto_ack=True)
+            if body is None:
+                time.sleep(0.2)
+        assert body is not None, "Expected the request in the parking queue"
+        assert json.loads(body)["request_id"] == "req-fatal"
+        assert properties.headers["x-parked-reason"] == "fatal"
+        assert properties.headers["x-error-type"] == "ValueError"
+        assert properties.headers["x-retry-attempt"] == 1
+
+        response = _get_message(channel, env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=2)
+        assert response is None, "Did not expect a response for a parked request"
+        for attempt in (1, 2):
+            queue = channel.queue_declare(
+                queue=f"{env['PLEXUS_RABBITMQ_REQUEST_QUEUE']}.retry.{attempt}", durable=True, passive=True
+            )
+            assert queue.method.message_count == 0
+
+        connection.close()
+
+
+def test_sigterm_drains_in_flight_job_before_closing(rabbitmq_setup):
+    rabbit, network = rabbitmq_setup
+    env = {
+        **REQUIRED_ENV,
+        "PLEXUS_RABBITMQ_REQUEST_QUEUE": "scoring-requests-drain",
+        "PLEXUS_RABBITMQ_RESPONSE_QUEUE": "scoring-responses-drain",
+        "PLEXUS_MOCK_DELAY_MS": "4000",
+    }
+
+    connection = _connect_pika(rabbit)
+    channel = connection.channel()
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True)
+    channel.queue_declare(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], durable=True)
+
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+        host = container.get_container_host_ip()
+        port = container.get_exposed_port(8080)
+        channel.basic_publish(
+            exchange="",
+            routing_key=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"],
+            body=json.dumps({"request_id": "req-drain", "scoring_job_id": "job-drain"}).encode(),
+        )
+        end = time.time() + 10
+        while time.time() < end and not _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]):
+            time.sleep(0.1)
+        assert _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]) == 1
+
+        # docker stop sends SIGTERM and blocks until the worker exits
+        stopper = threading.Thread(target=container.get_wrapped_container().stop, kwargs={"timeout": 20})
+        stopper.start()
+        draining = None
+        end = time.time() + 3
+        while time.time() < end and draining is None:
+            try:
+                ready = requests.get(f"http://{host}:{port}/readyz", timeout=1)
+            except requests.ConnectionError:
+                break
+            if ready.status_code == 503 and ready.json().get("draining"):
+                draining = ready.json()
+            else:
+                time.sleep(0.1)
+        stopper.join(timeout=30)
+        assert not stopper.is_alive()
+
+        assert draining is not None, "Expected /readyz to report draining"
+        assert draining["in_flight"] == 1
+        assert draining["drain_remaining_seconds"] > 0
+        container.get_wrapped_container().reload()
+        assert container.get_wrapped_container().attrs["State"]["ExitCode"] == 0
+        stdout = container.get_logs()[0].decode()
+        assert "Drain complete" in stdout
+
+        # The in-flight job was answered and acked before the connection closed
+        response = _get_message(channel, env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"], timeout=5)
+        assert response is not None, "Expected the in-flight job's response"
+        assert response["request_id"] == "req-drain"
+        assert response["status"] == "success"
+        assert _unacked_count(rabbit, env["PLEXUS_RABBITMQ_REQUEST_QUEUE"]) == 0
+        queue = channel.queue_declare(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"], durable=True, passive=True)
+        assert queue.method.message_count == 0
+
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_REQUEST_QUEUE"])
+    channel.queue_delete(queue=env["PLEXUS_RABBITMQ_RESPONSE_QUEUE"])
+    connection.close()
+
+
 def test_readiness_reports_not_ready_when_rabbitmq_down(rabbitmq_teardown_setup):
     rabbit, network = rabbitmq_teardown_setup
     with container_with_env(REQUIRED_ENV, network) as container:
@@ -121,3 +532,23 @@ def test_readiness_reports_not_ready_when_rabbitmq_down(rabbitmq_teardown_setup)
             time.sleep(1)
 
         assert status == 503
+
+
+def test_worker_reconnects_after_rabbitmq_restart(rabbitmq_teardown_setup):
+    rabbit, network = rabbitmq_teardown_setup
+    env = {**REQUIRED_ENV, "PLEXUS_RECONNECT_MAX_DELAY_MS": "2000"}
+    with container_with_env(env, network) as container:
+        wait_for_worker_ready(container)
+        host = container.get_container_host_ip()
+        port = container.get_exposed_port(8080)
+
+        rabbit.get_wrapped_container().stop(timeout=10)
+        time.sleep(3)
+        rabbit.get_wrapped_container().start()
+
+        wait_for_worker_ready(container, log_line="Reconnected to RabbitMQ", timeout=90)
+        resp = requests.get(f"http://{host}:{port}/readyz", timeout=2)
+        assert resp.status_code == 200
+
+        stats = requests.get(f"http://{host}:{port}/stats", timeout=2).json()
+        assert stats["connection"]["reconnects"] == 1
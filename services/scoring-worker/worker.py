@@ -13,27 +13,111 @@ Environment Variables:
     PLEXUS_RABBITMQ_REQUEST_QUEUE: Queue name for incoming scoring requests
     PLEXUS_RABBITMQ_RESPONSE_QUEUE: Queue name for outgoing scoring responses
     PLEXUS_RABBITMQ_PREFETCH: Number of messages to prefetch (default: 1)
+    PLEXUS_RABBITMQ_MAX_PRIORITY: Declare the request queue with x-max-priority (default: 0, FIFO)
+    PLEXUS_RABBITMQ_PREFETCH_MODE: 'fixed' (default) or 'adaptive' to tune prefetch at runtime
+    PLEXUS_RABBITMQ_PREFETCH_MIN: Lower bound for adaptive prefetch (default: 1)
+    PLEXUS_RABBITMQ_PREFETCH_MAX: Upper bound for adaptive prefetch (default: 32)
+    PLEXUS_ADAPTIVE_INTERVAL_SECONDS: Seconds between adaptive prefetch decisions (default: 10)
+    PLEXUS_RESULT_CACHE_PATH: SQLite file for cached score results (default: unset, cache disabled)
+    PLEXUS_RESULT_CACHE_TTL_SECONDS: Lifetime of a cached result (default: 604800)
+    PLEXUS_RESULT_CACHE_MAX_ENTRIES: Least recently used results beyond this are evicted (default: 100000)
+    PLEXUS_RETRY_MAX_ATTEMPTS: Delayed retries of transient failures before parking (default: 0, reject)
+    PLEXUS_RETRY_BASE_DELAY_MS: Delay before the first retry, doubled per attempt (default: 1000)
+    PLEXUS_RETRY_MAX_DELAY_MS: Upper bound on the retry delay (default: 300000)
+    PLEXUS_RECONNECT_BASE_DELAY_MS: Upper bound of the first jittered reconnect delay, doubled per attempt (default: 500)
+    PLEXUS_RECONNECT_MAX_DELAY_MS: Cap on the reconnect delay bound (default: 30000)
+    PLEXUS_BATCH_CONCURRENCY: Jobs of one batch request scored concurrently (default: 4)
+    PLEXUS_BULKHEAD_LIMIT: Default in-flight jobs per scorecard (default: 0, bulkheads disabled)
+    PLEXUS_BULKHEAD_LIMITS: Per-key overrides, e.g. 'scorecardId1=2,scorecardId2=8'
+    PLEXUS_BULKHEAD_KEY: 'scorecard' (default) or 'score'
+    PLEXUS_BULKHEAD_OVERFLOW: Shared slots usable by any key at its limit (default: 0)
+    PLEXUS_BULKHEAD_HOLD_MS: How long a job waits for a slot before being requeued (default: 1000)
+    PLEXUS_BULKHEAD_REQUEUE_DELAY_MS: Delay before a requeued job comes back (default: 1000; 0 requeues at the back at once)
+    PLEXUS_RABBITMQ_PUBLISH_MODE: 'inline' (default) or 'pipelined' response publishing
+    PLEXUS_RABBITMQ_CONFIRM_WINDOW: Max outstanding publisher confirms when pipelined (default: 64)
+    PLEXUS_RABBITMQ_ACK_BATCH_MS: Delay for coalescing request acks when pipelined (default: 10)
+    PLEXUS_RABBITMQ_PUBLISH_CHANNELS: Confirm-mode channels responses are published on (default: 1)
     PLEXUS_SCORING_MODE: 'real' or 'mock' (default: real)
+    PLEXUS_MOCK_DELAY_MS: Simulated scoring time per job in mock mode (default: 0)
+    PLEXUS_MOCK_FAIL_JOB_IDS: Comma-separated scoring job IDs that fail in mock mode
     PLEXUS_HEALTH_HOST: Health server bind host (default: 0.0.0.0)
     PLEXUS_HEALTH_PORT: Health server bind port (default: 8080)
+    PLEXUS_LOOP_LAG_INTERVAL_MS: Event-loop lag probe interval (default: 500)
+    PLEXUS_HEALTH_MAX_LOOP_LAG_MS: Report not-ready above this event-loop lag (default: 0, disabled)
+    PLEXUS_SHUTDOWN_DRAIN_SECONDS: How long SIGTERM waits for in-flight jobs before closing (default: 25)
+    PLEXUS_MAX_JOBS: Recycle the worker after about this many jobs (default: 0, disabled)
+    PLEXUS_MAX_RSS_MB: Recycle the worker once its RSS exceeds this (default: 0, disabled)
+    PLEXUS_WORKER_PROCESSES: Number of forked consumer processes (default: 1, no supervisor)
+    PLEXUS_THREAD_POOL_SIZE: Threads for blocking Plexus calls (default: 4 x max prefetch, min 8)
+    PLEXUS_SCORECARD_CACHE_SIZE: Max idle scorecard instances kept for reuse (default: 32, 0 disables)
+    PLEXUS_SCORECARD_CACHE_TTL_SECONDS: Max age of a cached scorecard instance (default: 600)
+    PLEXUS_WARMUP_SCORECARDS: Comma-separated scorecard:score external IDs to pre-build before ready
+    PLEXUS_LOOKUP_CACHE_TTL_SECONDS: TTL for cached Scorecard/Score lookups and ID resolution (default: 300)
+    PLEXUS_LOOKUP_CACHE_NEGATIVE_TTL_SECONDS: TTL for cached lookup misses (default: 30)
+    PLEXUS_LOOKUP_CACHE_SIZE: Max cached lookups (default: 1024)
+    PLEXUS_BATCH_LOADER_WINDOW_MS: Window for batching ScoringJob/Item fetches (default: 5, or 0 at prefetch 1; 0 disables)
+    PLEXUS_BATCH_LOADER_MAX_KEYS: Max IDs per batched fetch (default: 25)
+    PLEXUS_METADATA_DECODING: 'eager' (default) or 'lazy' JSON decoding of item metadata values
+    PLEXUS_LOG_QUEUE_SIZE: Log records buffered for the background log writer (default: 10000, 0 = synchronous)
+    PLEXUS_LOG_DROP_POLICY: 'drop' (default, shed info/debug when full) or 'block'
+    PLEXUS_LOG_SAMPLE_RATES: Keep 1 in N info/debug records per message or logger, e.g. 'Processed message=100'
+    PLEXUS_REQUEST_LOG_CAPTURE: Per-request log capture: 'off' (default), 'sampled' or 'always'
+    PLEXUS_REQUEST_LOG_SAMPLE_RATE: Fraction of requests captured in sampled mode (default: 0.01)
+    PLEXUS_REQUEST_LOG_BUFFER: Records kept per captured request, oldest dropped first (default: 200)
+    PLEXUS_REQUEST_LOG_SINKS: Where failed requests' logs go: 'disk', 'response' or both (default: disk)
+    PLEXUS_REQUEST_LOG_DIR: Directory for spilled request logs (default: /tmp/request-logs)
+    PLEXUS_REQUEST_LOG_MAX_FILES: Spilled files kept, oldest removed first (default: 1000)
+    PLEXUS_JSON_LIBRARY: 'auto' (default, orjson when installed), 'orjson' or 'json'
+    PLEXUS_STATUS_UPDATE_MODE: 'inline' (default) or 'write_behind' for ScoringJob status updates
+    PLEXUS_STATUS_FLUSH_INTERVAL_MS: Write-behind flush interval (default: 200)
+    PLEXUS_STATUS_FLUSH_BATCH_SIZE: Max status updates written per flush (default: 50)
     LOG_FORMAT: 'json' (default) or 'text' for plain-text local dev output
 """
 
 import asyncio
+import atexit
+import bisect
+import contextvars
+import hashlib
+import importlib
+import itertools
 import json
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+import random
+import re
+import resource
 import signal
+import sqlite3
 import sys
+import time
 import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from datetime import datetime, timezone
 from decimal import Decimal
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from threading import Thread
+from multiprocessing.connection import wait as wait_for_connections
+from threading import Event, Lock, Thread
+from types import SimpleNamespace
 
 import aio_pika
 from pythonjsonlogger import jsonlogger
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON, falls back to the standard library
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for application/msgpack messages
+    msgpack = None
+
 os.environ.setdefault('SCORECARD_CACHE_DIR', '/tmp/scorecards')
 os.environ.setdefault('MPLBACKEND', 'Agg')
 os.environ.setdefault('MPLCONFIGDIR', '/tmp/mpl')
@@ -51,13 +135,400 @@ REQUIRED_VARS = [
 ]
 
 DEFAULT_PREFETCH = 1
+DEFAULT_MAX_PRIORITY = 0
+DEFAULT_PREFETCH_MODE = "fixed"
+DEFAULT_PREFETCH_MIN = 1
+DEFAULT_PREFETCH_MAX = 32
+DEFAULT_ADAPTIVE_INTERVAL_SECONDS = 10.0
+DEFAULT_RESULT_CACHE_TTL_SECONDS = 7 * 24 * 3600.0
+DEFAULT_RESULT_CACHE_MAX_ENTRIES = 100_000
+DEFAULT_BATCH_CONCURRENCY = 4
+DEFAULT_RETRY_MAX_ATTEMPTS = 0
+DEFAULT_RETRY_BASE_DELAY_MS = 1000.0
+DEFAULT_RETRY_MAX_DELAY_MS = 300_000.0
+DEFAULT_RECONNECT_BASE_DELAY_MS = 500.0
+DEFAULT_RECONNECT_MAX_DELAY_MS = 30_000.0
+RETRY_ATTEMPT_HEADER = "x-retry-attempt"
+# Exception class names (anywhere in the cause chain) treated as transient: Plexus API
+# transport errors and the rate-limit/overload errors of the LLM provider SDKs.
+RETRYABLE_ERROR_NAMES = frozenset({
+    "APIConnectionError",
+    "APITimeoutError",
+    "ConnectTimeout",
+    "InternalServerError",
+    "OverloadedError",
+    "RateLimitError",
+    "ReadTimeout",
+    "ServiceUnavailableError",
+    "ThrottlingException",
+    "TransportConnectionFailed",
+    "TransportServerError",
+})
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+DEFAULT_BULKHEAD_LIMIT = 0
+DEFAULT_BULKHEAD_KEY = "scorecard"
+DEFAULT_BULKHEAD_OVERFLOW = 0
+DEFAULT_BULKHEAD_HOLD_MS = 1000.0
+DEFAULT_BULKHEAD_REQUEUE_DELAY_MS = 1000.0
+DEFAULT_PUBLISH_MODE = "inline"
+DEFAULT_CONFIRM_WINDOW = 64
+DEFAULT_ACK_BATCH_MS = 10.0
+DEFAULT_PUBLISH_CHANNELS = 1
 DEFAULT_HEALTH_HOST = "0.0.0.0"
 DEFAULT_HEALTH_PORT = 8080
+DEFAULT_LOOP_LAG_INTERVAL_MS = 500.0
+DEFAULT_HEALTH_MAX_LOOP_LAG_MS = 0.0
+DEFAULT_WORKER_PROCESSES = 1
+MIN_THREAD_POOL_SIZE = 8
+THREADS_PER_IN_FLIGHT_JOB = 4
+DEFAULT_SCORECARD_CACHE_SIZE = 32
+DEFAULT_SCORECARD_CACHE_TTL_SECONDS = 600.0
+DEFAULT_LOOKUP_CACHE_TTL_SECONDS = 300.0
+DEFAULT_LOOKUP_CACHE_NEGATIVE_TTL_SECONDS = 30.0
+DEFAULT_LOOKUP_CACHE_SIZE = 1024
+DEFAULT_BATCH_LOADER_WINDOW_MS = 5.0
+DEFAULT_BATCH_LOADER_MAX_KEYS = 25
+DEFAULT_METADATA_DECODING = "eager"
+DEFAULT_STATUS_UPDATE_MODE = "inline"
+DEFAULT_STATUS_FLUSH_INTERVAL_MS = 200.0
+DEFAULT_STATUS_FLUSH_BATCH_SIZE = 50
 SERVICE_NAME = "scoring-worker"
 
+# Heavy modules imported by the supervisor before forking so children share them copy-on-write
+PRELOAD_MODULES = [
+    'nltk',
+    'plexus.dashboard.api.client',
+    'plexus.dashboard.api.models.account',
+    'plexus.dashboard.api.models.item',
+    'plexus.dashboard.api.models.score',
+    'plexus.dashboard.api.models.scorecard',
+    'plexus.dashboard.api.models.scoring_job',
+    'plexus.utils.scoring',
+]
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+DEFAULT_REQUEST_LOG_CAPTURE = "off"
+DEFAULT_REQUEST_LOG_SAMPLE_RATE = 0.01
+DEFAULT_REQUEST_LOG_BUFFER = 200
+DEFAULT_REQUEST_LOG_SINKS = "disk"
+DEFAULT_REQUEST_LOG_DIR = "/tmp/request-logs"
+DEFAULT_REQUEST_LOG_MAX_FILES = 1000
+DEFAULT_LOG_DROP_POLICY = "drop"
+DEFAULT_SHUTDOWN_DRAIN_SECONDS = 25.0
+DEFAULT_MAX_JOBS = 0
+DEFAULT_MAX_RSS_MB = 0
+# Exit status of a worker that stopped itself to be recycled (EX_TEMPFAIL)
+RECYCLE_EXIT_CODE = 75
+CHILD_HEALTH_REPORT_INTERVAL = 1.0
+# Grace given to a child beyond its drain deadline before it is killed
+CHILD_STOP_TIMEOUT = 5
+# A child whose health reports stop arriving (e.g. a stuck event loop) is treated as not ready
+CHILD_HEALTH_STALE_AFTER = 5 * CHILD_HEALTH_REPORT_INTERVAL
+# A child that crashes within CHILD_FAST_FAILURE_SECONDS of starting is restarted after
+# an exponential delay; after CHILD_MAX_FAST_FAILURES in a row the supervisor gives up
+# and exits non-zero so the orchestrator surfaces the failure.
+CHILD_RESTART_BASE_DELAY = 1.0
+CHILD_RESTART_MAX_DELAY = 60.0
+CHILD_FAST_FAILURE_SECONDS = 60.0
+CHILD_MAX_FAST_FAILURES = 5
+
+
+# Builtin subclasses that orjson/msgpack are told to hand to default() instead of
+# reading their raw storage, which would skip overrides such as LazyJSONDict's.
+_SUBCLASS_TYPES = (dict, list, tuple, str, int)
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, int):
+        return int(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class Codec:
+    """Message body serialization for one content type.
+
+    encode() returns bytes and converts Decimal (as returned by DynamoDB-backed
+    Plexus records) to float through its default hook rather than a separate walk.
+    Builtin subclasses also go through the hook, so a LazyJSONDict is written
+    fully decoded rather than from its raw storage.
+    decode() takes the body bytes as they arrive.
+    """
+
+    def __init__(self, name: str, content_type: str, dumps, loads):
+        self.name = name
+        self.content_type = content_type
+        self._dumps = dumps
+        self._loads = loads
+
+    def encode(self, value, default=_json_default) -> bytes:
+        return self._dumps(value, default)
+
+    def decode(self, data: bytes):
+        return self._loads(data)
+
+
+def _make_json_codec():
+    library = os.environ.get('PLEXUS_JSON_LIBRARY', 'auto').lower()
+    if orjson is not None and library in ('auto', 'orjson'):
+        return Codec(
+            "orjson",
+            "application/json",
+            lambda value, default: orjson.dumps(
+                value, default=default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS
+            ),
+            orjson.loads,
+        )
+    if library == 'orjson':
+        logging.warning("PLEXUS_JSON_LIBRARY=orjson but orjson is not installed, using json")
+    return Codec(
+        "json",
+        "application/json",
+        lambda value, default: json.dumps(value, default=default).encode(),
+        json.loads,
+    )
+
+
+JSON_CODEC = _make_json_codec()
+CODECS = {"application/json": JSON_CODEC}
+if msgpack is not None:
+    MSGPACK_CODEC = Codec(
+        "msgpack",
+        "application/msgpack",
+        lambda value, default: msgpack.packb(value, default=default, use_bin_type=True, strict_types=True),
+        lambda data: msgpack.unpackb(data, raw=False),
+    )
+    CODECS["application/msgpack"] = MSGPACK_CODEC
+    CODECS["application/x-msgpack"] = MSGPACK_CODEC
+
+
+def codec_for(content_type) -> Codec:
+    """Codec for an AMQP content_type; missing or unknown types are treated as JSON."""
+    if not content_type:
+        return JSON_CODEC
+    return CODECS.get(content_type.split(';', 1)[0].strip().lower(), JSON_CODEC)
+
+
+def _log_serializer(log_record, default=None, **kwargs):
+    """json.dumps-compatible serializer for python-json-logger backed by JSON_CODEC."""
+    fallback = default or str
+
+    def log_default(value):
+        return _json_default(value) if isinstance(value, _SUBCLASS_TYPES) else fallback(value)
+
+    return JSON_CODEC.encode(log_record, default=log_default).decode()
+
+
+class SamplingFilter(logging.Filter):
+    """Keep 1 in N records below WARNING for configured messages or logger names.
+
+    rates maps a message format string (e.g. "Processed message") or a logger name
+    to N. Warnings and errors always pass.
+    """
+
+    def __init__(self, rates: dict):
+        super().__init__()
+        self.rates = rates
+        self._counters = {key: itertools.count() for key in rates}
+
+    @classmethod
+    def parse_rates(cls, raw: str) -> dict:
+        rates = {}
+        for entry in raw.split(','):
+            key, _, value = entry.rpartition('=')
+            if key.strip() and value.strip():
+                rates[key.strip()] = max(1, int(value))
+        return rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        # msg can be any object (e.g. a dict), which may not be hashable
+        key = record.msg if isinstance(record.msg, str) and record.msg in self.rates else record.name
+        rate = self.rates.get(key)
+        if rate is None or next(self._counters[key]) % rate == 0:
+            return True
+        LOG_RECORDS_DROPPED.inc("sampled")
+        return False
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a bounded queue that leaves formatting to the listener thread.
+
+    drop: when the queue is full, records below WARNING are dropped and counted;
+    warnings and errors wait for space. block: every record waits for space.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str):
+        super().__init__(log_queue)
+        self.policy = policy
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats on the calling thread (the event loop); the
+        # listener's handler formats instead. Records are never pickled, so no copy.
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.policy == 'block' or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc("queue_full")
+
+
+_request_log_buffer = contextvars.ContextVar("request_log_buffer", default=None)
+
+
+class RequestLogHandler(logging.Handler):
+    """Appends records to the ring buffer of the request being captured, if any.
+
+    The buffer lives in a context variable, so it follows the request into the tasks
+    and run_blocking threads it starts and costs one lookup for everything else.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        buffer = _request_log_buffer.get()
+        if buffer is None:
+            return
+        entry = {
+            "timestamp": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and record.exc_info[1] is not None:
+            entry["error"] = repr(record.exc_info[1])
+        buffer.append(entry)
+
+
+class RequestLogCapture:
+    """Opt-in capture of one request's log records, kept only when the request fails.
+
+    mode is 'off', 'sampled' (a sample_rate fraction of requests) or 'always'. A
+    captured request keeps its last buffer_size records. On failure they are written
+    to `<directory>/<name>.jsonl` (sink 'disk', at most max_files files) and/or
+    returned for the failure response (sink 'response').
+    """
+
+    def __init__(self, mode: str, sample_rate: float, buffer_size: int, sinks: set,
+                 directory: str, max_files: int):
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.sinks = sinks
+        self.directory = directory
+        self.max_files = max_files
+        self.captured = 0
+        self.failures = 0
+        self.spilled = 0
+        self.spill_errors = 0
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "captured": self.captured,
+            "failures": self.failures,
+            "spilled": self.spilled,
+            "spill_errors": self.spill_errors,
+        }
+
+    @contextmanager
+    def capture(self):
+        """Yield a ring buffer collecting this request's records, or None if not captured."""
+        if self.mode == 'off' or (self.mode == 'sampled' and random.random() >= self.sample_rate):
+            yield None
+            return
+        self.captured += 1
+        buffer = deque(maxlen=self.buffer_size)
+        token = _request_log_buffer.set(buffer)
+        try:
+            yield buffer
+        finally:
+            _request_log_buffer.reset(token)
+
+    async def on_failure(self, name: str, buffer, error: Exception):
+        """Spill a failed request's records and attach them to error as request_logs."""
+        if buffer is None:
+            return
+        self.failures += 1
+        records = list(buffer)
+        if 'disk' in self.sinks:
+            try:
+                await run_blocking("request_logs.spill", self._spill, name, records)
+                self.spilled += 1
+            except Exception:
+                self.spill_errors += 1
+                logging.warning("Failed to spill request logs", extra={"request": name}, exc_info=True)
+        if 'response' in self.sinks:
+            error.request_logs = records
+
+    def _spill(self, name: str, records: list):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, re.sub(r'[^A-Za-z0-9._-]', '_', name) + ".jsonl")
+        with open(path, "wb") as f:
+            for record in records:
+                f.write(JSON_CODEC.encode(record, default=str) + b"\n")
+        files = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith(".jsonl")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in files[:max(0, len(files) - self.max_files)]:
+            os.remove(entry.path)
+
+
+# (QueueListener, owning pid, output handler) of the background log writer
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Flush queued log records. Only the process that started the listener owns it."""
+    global _log_listener
+    if _log_listener is not None and _log_listener[1] == os.getpid():
+        _log_listener[0].stop()
+    _log_listener = None
+
+
+def _owned_log_handler():
+    if _log_listener is not None and _log_listener[1] == os.getpid():
+        return _log_listener[2]
+    return None
+
+
+def _before_fork():
+    # Hold the writer's handler lock so no stdout write is in progress at fork time;
+    # logging re-creates handler locks in the child.
+    handler = _owned_log_handler()
+    if handler is not None:
+        handler.acquire()
+
+
+def _after_fork_in_parent():
+    handler = _owned_log_handler()
+    if handler is not None:
+        handler.release()
+
+
+atexit.register(_stop_log_listener)
+os.register_at_fork(before=_before_fork, after_in_parent=_after_fork_in_parent)
+
 
 def configure_logging():
-    """Configure logging as JSON (default) or plain text (LOG_FORMAT=text)."""
+    """Configure logging as JSON (default) or plain text (LOG_FORMAT=text).
+
+    Records are written to stdout by a background thread fed through a bounded queue
+    (PLEXUS_LOG_QUEUE_SIZE), so a slow log collector does not stall the event loop.
+    Forked workers call this again to start their own writer thread.
+    """
+    global _log_listener
+    _stop_log_listener()
     log_format = os.environ.get("LOG_FORMAT", "json").lower()
     handler = logging.StreamHandler(sys.stdout)
 
@@ -67,19 +538,351 @@ def configure_logging():
         formatter = jsonlogger.JsonFormatter(
             fmt='%(asctime)s %(levelname)s %(name)s %(message)s',
             rename_fields={'asctime': 'timestamp', 'levelname': 'level', 'name': 'logger'},
+            json_default=jsonlogger.JsonEncoder().default,
+            json_serializer=_log_serializer,
         )
         formatter.default_msec_format = '%s.%03d'
         handler.setFormatter(formatter)
 
+    queue_size = int(os.environ.get('PLEXUS_LOG_QUEUE_SIZE', DEFAULT_LOG_QUEUE_SIZE))
+    if queue_size > 0:
+        log_queue = queue.Queue(maxsize=queue_size)
+        listener = logging.handlers.QueueListener(log_queue, handler)
+        listener.start()
+        _log_listener = (listener, os.getpid(), handler)
+        handler = BoundedQueueHandler(
+            log_queue, os.environ.get('PLEXUS_LOG_DROP_POLICY', DEFAULT_LOG_DROP_POLICY).lower()
+        )
+        METRICS.gauge("scoring_worker_log_queue_depth", "Log records waiting to be written.", log_queue.qsize)
+
+    sample_rates = SamplingFilter.parse_rates(os.environ.get('PLEXUS_LOG_SAMPLE_RATES', ''))
+    if sample_rates:
+        handler.addFilter(SamplingFilter(sample_rates))
+
     root = logging.getLogger()
     root.setLevel(logging.INFO)
-    root.handlers = [handler]
-    logging.getLogger().info("Logging configured", extra={"service": SERVICE_NAME, "log_format": log_format})
+    # The capture handler sits beside the sampled, queued one so captured requests
+    # keep every record.
+    root.handlers = [handler, RequestLogHandler()]
+    logging.getLogger().info(
+        "Logging configured",
+        extra={
+            "service": SERVICE_NAME,
+            "log_format": log_format,
+            "json_library": JSON_CODEC.name,
+            "log_queue_size": queue_size,
+            "log_sample_rates": sample_rates,
+        },
+    )
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self.values = {}
+
+    def inc(self, *labels, amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self):
+        return [(self.name, labels, value) for labels, value in list(self.values.items())]
+
+
+class Gauge:
+    """Gauge read from a callback at scrape time.
+
+    Without labelnames the callback returns a number; with labelnames it returns a
+    dict of label-value tuples to numbers.
+    """
+
+    def __init__(self, name: str, help_text: str, callback, labelnames: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self.callback = callback
+
+    def samples(self):
+        if not self.labelnames:
+            return [(self.name, (), float(self.callback()))]
+        return [(self.name, labels, float(value)) for labels, value in self.callback().items()]
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labelnames: tuple = (), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self.series = {}
+
+    def observe(self, value: float, *labels):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def samples(self):
+        samples = []
+        for labels, (counts, total, count) in list(self.series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), list(counts)):
+                cumulative += bucket_count
+                samples.append((f"{self.name}_bucket", labels + (bound,), cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, count))
+        return samples
+
+
+class MetricsRegistry:
+    """Minimal Prometheus registry; recording is a dict lookup and a few additions."""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def counter(self, name: str, help_text: str, labelnames: tuple = ()) -> Counter:
+        return self._metrics.setdefault(name, Counter(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: tuple = ()) -> Histogram:
+        return self._metrics.setdefault(name, Histogram(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, callback, labelnames: tuple = ()) -> Gauge:
+        self._metrics[name] = Gauge(name, help_text, callback, labelnames)
+        return self._metrics[name]
+
+    def snapshot(self) -> list:
+        """Plain-data copy of every metric, safe to send to a supervisor."""
+        families = []
+        for metric in list(self._metrics.values()):
+            labelnames = metric.labelnames
+            if isinstance(metric, Histogram):
+                labelnames = labelnames + ("le",)
+            families.append({
+                "name": metric.name,
+                "type": type(metric).__name__.lower(),
+                "help": metric.help,
+                "samples": [
+                    [name, dict(zip(labelnames, labels)), value]
+                    for name, labels, value in metric.samples()
+                ],
+            })
+        return families
+
+
+def _format_label_value(value) -> str:
+    if isinstance(value, float):
+        return "+Inf" if value == float("inf") else repr(value)
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(snapshots: list) -> str:
+    """Render [(extra_labels, snapshot), ...] in the Prometheus text exposition format."""
+    families = OrderedDict()
+    for extra_labels, snapshot in snapshots:
+        for family in snapshot:
+            entry = families.setdefault(family["name"], (family, []))
+            for name, labels, value in family["samples"]:
+                entry[1].append((name, {**extra_labels, **labels}, value))
+
+    lines = []
+    for name, (family, samples) in families.items():
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        for sample_name, labels, value in samples:
+            if labels:
+                rendered = ",".join(f'{k}="{_format_label_value(v)}"' for k, v in labels.items())
+                lines.append(f"{sample_name}{{{rendered}}} {value}")
+            else:
+                lines.append(f"{sample_name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+STAGE_SECONDS = METRICS.histogram(
+    "scoring_worker_stage_duration_seconds",
+    "Duration of each job stage (preparation stages, score, status_update, publish).",
+    ("stage",),
+)
+JOB_SECONDS = METRICS.histogram(
+    "scoring_worker_job_duration_seconds",
+    "End-to-end handling time of one request message.",
+)
+MESSAGES_TOTAL = METRICS.counter(
+    "scoring_worker_messages_total",
+    "Request messages handled, by outcome.",
+    ("outcome",),
+)
+LOG_RECORDS_DROPPED = METRICS.counter(
+    "scoring_worker_log_records_dropped_total",
+    "Log records not written, by reason (queue_full, sampled).",
+    ("reason",),
+)
+BATCH_ITEMS_TOTAL = METRICS.counter(
+    "scoring_worker_batch_items_total",
+    "Scoring jobs handled as part of batch requests, by outcome.",
+    ("outcome",),
+)
+MESSAGES_BY_PRIORITY = METRICS.counter(
+    "scoring_worker_messages_by_priority_total",
+    "Request messages received, by AMQP priority.",
+    ("priority",),
+)
+PUBLISH_WINDOW_WAIT_SECONDS = METRICS.histogram(
+    "scoring_worker_publish_window_wait_seconds",
+    "Time a pipelined publish waited for a free confirm window slot.",
+)
+RECONNECTS_TOTAL = METRICS.counter(
+    "scoring_worker_rabbitmq_reconnects_total",
+    "RabbitMQ connections re-established after an outage.",
+)
+CONNECT_FAILURES_TOTAL = METRICS.counter(
+    "scoring_worker_rabbitmq_connect_failures_total",
+    "Failed RabbitMQ connection attempts.",
+)
+OUTAGE_SECONDS = METRICS.histogram(
+    "scoring_worker_rabbitmq_outage_seconds",
+    "Time from losing the RabbitMQ connection to consuming again.",
+)
+
+
+class LoopLagMonitor:
+    """Measures event-loop scheduling delay by timing a periodic sleep.
+
+    The health server runs on its own thread, so it keeps answering while the loop is
+    starved. current_lag() also counts the time since the last tick, which makes a
+    loop that is stuck outright show up as growing lag rather than a stale reading.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._last_tick = time.monotonic()
+
+    def current_lag(self) -> float:
+        overdue = time.monotonic() - self._last_tick - self.interval
+        return max(self.lag, overdue, 0.0)
+
+    def stats(self) -> dict:
+        return {
+            "lag_seconds": round(self.current_lag(), 6),
+            "max_lag_seconds": round(self.max_lag, 6),
+            "interval_seconds": self.interval,
+        }
+
+    async def run(self, shutdown: asyncio.Event):
+        while not shutdown.is_set():
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._last_tick = time.monotonic()
+            self.lag = max(0.0, self._last_tick - started - self.interval)
+            self.max_lag = max(self.max_lag, self.lag)
 
 
 class HealthState:
     def __init__(self):
-        self.ready = False
+        self.warmed_up = False
+        self.connected = False
+        self.stats_providers = {}
+        self.loop_lag = None
+        self.max_loop_lag = 0.0
+        self.draining = False
+        self.drain_progress = None
+
+    @property
+    def loop_responsive(self) -> bool:
+        if self.loop_lag is None or self.max_loop_lag <= 0:
+            return True
+        return self.loop_lag.current_lag() <= self.max_loop_lag
+
+    @property
+    def ready(self) -> bool:
+        return self.warmed_up and self.connected and self.loop_responsive and not self.draining
+
+    def stats(self) -> dict:
+        return {name: provider() for name, provider in self.stats_providers.items()}
+
+    def snapshot(self) -> dict:
+        """State reported by a supervised child to its parent."""
+        return {
+            "ready": self.ready,
+            "draining": self.draining,
+            "stats": self.stats(),
+            "metrics": METRICS.snapshot(),
+        }
+
+    def metrics(self) -> str:
+        return render_metrics([({}, METRICS.snapshot())])
+
+    def details(self) -> dict:
+        details = {}
+        if self.loop_lag is not None:
+            details["loop_lag_seconds"] = round(self.loop_lag.current_lag(), 4)
+        if self.draining:
+            details["draining"] = True
+            if self.drain_progress is not None:
+                details.update(self.drain_progress())
+        return details
+
+
+class SupervisorHealthState:
+    """Combined health of supervised child processes, as reported over their pipes."""
+
+    def __init__(self):
+        self.children = {}
+        self.draining = False
+
+    def update(self, index: int, snapshot: dict):
+        self.children[index] = {**snapshot, "received_at": time.monotonic()}
+
+    def forget(self, index: int):
+        self.children.pop(index, None)
+
+    def _child_ready(self, child: dict) -> bool:
+        fresh = time.monotonic() - child["received_at"] <= CHILD_HEALTH_STALE_AFTER
+        return bool(child.get("ready")) and fresh
+
+    @property
+    def ready(self) -> bool:
+        if self.draining:
+            return False
+        return any(self._child_ready(child) for child in self.children.values())
+
+    def stats(self) -> dict:
+        return {
+            "workers": {
+                str(index): child.get("stats", {})
+                for index, child in sorted(self.children.items())
+            }
+        }
+
+    def metrics(self) -> str:
+        return render_metrics([
+            ({"worker": str(index)}, child.get("metrics", []))
+            for index, child in sorted(self.children.items())
+        ])
+
+    def _child_status(self, child: dict) -> str:
+        if child.get("draining"):
+            return "draining"
+        return "ready" if self._child_ready(child) else "not_ready"
+
+    def details(self) -> dict:
+        details = {
+            "workers": {
+                str(index): self._child_status(child)
+                for index, child in sorted(self.children.items())
+            }
+        }
+        if self.draining:
+            details["draining"] = True
+        return details
 
 
 def _make_health_handler(state: HealthState):
@@ -92,9 +895,15 @@ def _make_health_handler(state: HealthState):
                 return
             if self.path == "/readyz":
                 if state.ready:
-                    self._send(200, {"status": "ready"})
+                    self._send(200, {"status": "ready", **state.details()})
                 else:
-                    self._send(503, {"status": "not_ready"})
+                    self._send(503, {"status": "not_ready", **state.details()})
+                return
+            if self.path == "/stats":
+                self._send(200, state.stats())
+                return
+            if self.path == "/metrics":
+                self._send_text(200, state.metrics(), "text/plain; version=0.0.4; charset=utf-8")
                 return
             self._send(404, {"error": "not_found"})
 
@@ -103,9 +912,12 @@ def _make_health_handler(state: HealthState):
             return
 
         def _send(self, status, body):
-            payload = json.dumps(body).encode()
+            self._send_text(status, json.dumps(body), "application/json")
+
+        def _send_text(self, status, body, content_type):
+            payload = body.encode()
             self.send_response(status)
-            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Type", content_type)
             self.send_header("Content-Length", str(len(payload)))
             self.end_headers()
             self.wfile.write(payload)
@@ -113,7 +925,7 @@ def _make_health_handler(state: HealthState):
     return HealthHandler
 
 
-def start_health_server(state: HealthState):
+def start_health_server(state):
     host = os.environ.get("PLEXUS_HEALTH_HOST", DEFAULT_HEALTH_HOST)
     port = int(os.environ.get("PLEXUS_HEALTH_PORT", DEFAULT_HEALTH_PORT))
     server = HTTPServer((host, port), _make_health_handler(state))
@@ -124,20 +936,795 @@ def start_health_server(state: HealthState):
     return server
 
 
-def _json_safe(value):
-    if isinstance(value, Decimal):
-        return float(value)
-    if isinstance(value, dict):
-        return {k: _json_safe(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_json_safe(v) for v in value]
-    return value
+_blocking_call_site = contextvars.ContextVar("blocking_call_site", default="other")
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool for blocking Plexus calls that records queue wait and call durations.
+
+    Installed as the event loop's default executor, so asyncio.to_thread and
+    run_in_executor(None, ...) also land here. Work submitted through run_blocking()
+    is attributed to its call site; anything else is counted under "other".
+    """
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix="plexus-blocking")
+        self.size = max_workers
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.call_sites = {}
+        self._stats_lock = Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(self._instrument(_blocking_call_site.get(), fn, args, kwargs))
+
+    def _instrument(self, call_site: str, fn, args, kwargs):
+        submitted = time.monotonic()
+        with self._stats_lock:
+            self.queued += 1
+
+        def call():
+            started = time.monotonic()
+            wait = started - submitted
+            with self._stats_lock:
+                self.queued -= 1
+                self.active += 1
+                self.queue_wait_total += wait
+                self.queue_wait_max = max(self.queue_wait_max, wait)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                duration = time.monotonic() - started
+                with self._stats_lock:
+                    self.active -= 1
+                    self.completed += 1
+                    site = self.call_sites.setdefault(call_site, [0, 0.0, 0.0])
+                    site[0] += 1
+                    site[1] += duration
+                    site[2] = max(site[2], duration)
+
+        return call
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "size": self.size,
+                "active": self.active,
+                "queued": self.queued,
+                "completed": self.completed,
+                "queue_wait_avg_seconds": round(self.queue_wait_total / self.completed, 6)
+                if self.completed else 0.0,
+                "queue_wait_max_seconds": round(self.queue_wait_max, 6),
+                "call_sites": {
+                    name: {
+                        "count": count,
+                        "avg_seconds": round(total / count, 6),
+                        "max_seconds": round(longest, 6),
+                    }
+                    for name, (count, total, longest) in self.call_sites.items()
+                },
+            }
+
+
+async def run_blocking(call_site: str, fn, *args, **kwargs):
+    """asyncio.to_thread, attributed to call_site in the thread pool stats."""
+    token = _blocking_call_site.set(call_site)
+    try:
+        # to_thread submits synchronously, so the executor sees this context's call site
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    finally:
+        _blocking_call_site.reset(token)
 
 
 def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+class LazyJSONDict(dict):
+    """Item metadata whose string values are JSON-decoded on first read.
+
+    Values that parse as JSON are replaced by the parsed value the first time they
+    are read, and kept as strings otherwise, exactly as eager decoding did. Keyed
+    access (m[k], get, pop, setdefault) decodes only that key; anything that sees
+    every value (items, values, ==, repr, |, copying, pickling) decodes all pending
+    keys first. __iter__ is overridden so C-level merges such as dict(m) and {**m}
+    go through __getitem__ instead of reading the raw storage. orjson and msgpack
+    read that storage directly too, so Codec.encode hands them the decoded copy.
+
+    Serializers outside the worker can still read the storage directly and see
+    pending values as their JSON strings: ormsgpack, which LangGraph uses for
+    checkpoints, does. Scorecards therefore get decoded() unless lazy decoding is
+    turned on for scorecards known not to serialize their metadata.
+    """
+
+    def __init__(self, metadata: dict):
+        super().__init__(metadata)
+        self._pending = {key for key, value in metadata.items() if isinstance(value, str)}
+
+    def _decode(self, key):
+        if key in self._pending:
+            self._pending.discard(key)
+            try:
+                super().__setitem__(key, json.loads(super().__getitem__(key)))
+            except ValueError:
+                pass
+
+    def _decode_all(self):
+        for key in list(self._pending):
+            self._decode(key)
+
+    def decoded(self) -> dict:
+        """A plain dict with every value decoded."""
+        return dict(self.items())
+
+    def raw_items(self):
+        """Items without decoding anything (pending values are still JSON strings)."""
+        return super().items()
+
+    def __getitem__(self, key):
+        self._decode(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._pending.discard(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._pending.discard(key)
+        super().__delitem__(key)
+
+    def __iter__(self):
+        return iter(super().keys())
+
+    def __eq__(self, other):
+        self._decode_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self._decode_all()
+        return super().__ne__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._decode_all()
+        return super().__repr__()
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = dict(self.items())
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = dict(other)
+        merged.update(self.items())
+        return merged
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def items(self):
+        self._decode_all()
+        return super().items()
+
+    def values(self):
+        self._decode_all()
+        return super().values()
+
+    def pop(self, key, *default):
+        self._decode(key)
+        self._pending.discard(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        self._decode_all()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self._pending.clear()
+        super().clear()
+
+    def copy(self):
+        clone = LazyJSONDict({})
+        dict.update(clone, self.raw_items())
+        clone._pending = set(self._pending)
+        return clone
+
+
+class AdaptiveConcurrencyController:
+    """AIMD controller that tunes the prefetch limit from observed job latency and errors.
+
+    Completed jobs are recorded into a window. Once per interval the window is
+    evaluated against a slowly-drifting latency baseline:
+
+    - error rate above ERROR_RATE_THRESHOLD -> multiplicative decrease
+    - average latency above baseline * LATENCY_TOLERANCE -> multiplicative decrease
+    - all slots in use and latency healthy -> additive increase
+    - otherwise hold
+    """
+
+    ERROR_RATE_THRESHOLD = 0.1
+    LATENCY_TOLERANCE = 2.0
+    BACKOFF_FACTOR = 0.5
+    LATENCY_BACKOFF_FACTOR = 0.75
+    BASELINE_DRIFT = 1.05
+
+    def __init__(self, initial: int, minimum: int, maximum: int, interval: float):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.interval = interval
+        self.baseline_latency = None
+        self._reset_window(time.monotonic())
+
+    def _reset_window(self, now: float):
+        self._window_start = now
+        self._latencies = []
+        self._errors = 0
+        self._peak_in_flight = 0
+
+    def record(self, latency: float, ok: bool, in_flight: int):
+        """Record a finished job. Returns the new limit when it changed, else None."""
+        self._latencies.append(latency)
+        if not ok:
+            self._errors += 1
+        self._peak_in_flight = max(self._peak_in_flight, in_flight)
+
+        now = time.monotonic()
+        if now - self._window_start < self.interval:
+            return None
+        return self._decide(now)
+
+    def _decide(self, now: float):
+        samples = len(self._latencies)
+        avg_latency = sum(self._latencies) / samples
+        error_rate = self._errors / samples
+        saturated = self._peak_in_flight >= self.limit
+
+        if self.baseline_latency is None:
+            self.baseline_latency = avg_latency
+        else:
+            self.baseline_latency = min(avg_latency, self.baseline_latency * self.BASELINE_DRIFT)
+
+        previous = self.limit
+        if error_rate > self.ERROR_RATE_THRESHOLD:
+            reason = "error_rate"
+            self.limit = max(self.minimum, int(self.limit * self.BACKOFF_FACTOR))
+        elif avg_latency > self.baseline_latency * self.LATENCY_TOLERANCE:
+            reason = "latency"
+            self.limit = max(self.minimum, int(self.limit * self.LATENCY_BACKOFF_FACTOR))
+        elif saturated:
+            reason = "saturated"
+            self.limit = min(self.maximum, self.limit + 1)
+        else:
+            reason = "underutilized"
+
+        decision = {
+            "reason": reason,
+            "previous_prefetch": previous,
+            "prefetch": self.limit,
+            "samples": samples,
+            "avg_latency_seconds": round(avg_latency, 4),
+            "baseline_latency_seconds": round(self.baseline_latency, 4),
+            "error_rate": round(error_rate, 4),
+            "peak_in_flight": self._peak_in_flight,
+        }
+        self._reset_window(now)
+
+        if self.limit == previous:
+            logging.info("Adaptive prefetch unchanged", extra=decision)
+            return None
+        logging.info("Adaptive prefetch changed", extra=decision)
+        return self.limit
+
+
+class ScorecardInstanceCache:
+    """Bounded LRU pool of ready-to-use scorecard instances keyed by (scorecard, score,
+    score version); the version is None unless the result cache needs it.
+
+    Instances are checked out for the duration of a job and returned afterwards, so
+    concurrent jobs for the same score never share an instance: a job that finds no
+    idle instance builds its own. Idle instances expire after ttl seconds, and the
+    least recently used keys are evicted once more than max_size instances are idle.
+    """
+
+    def __init__(self, factory, max_size: int, ttl: float):
+        self.factory = factory
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._idle = OrderedDict()
+        self._size = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": self._size,
+            "keys": len(self._idle),
+        }
+
+    @asynccontextmanager
+    async def acquire(self, key: tuple):
+        entry = self._take(key)
+        if entry is None:
+            self.misses += 1
+            entry = (await self.factory(*key), time.monotonic())
+        else:
+            self.hits += 1
+        yield entry[0]
+        # Only instances that completed a job go back to the pool
+        self._release(key, entry)
+
+    def _take(self, key):
+        idle = self._idle.get(key)
+        now = time.monotonic()
+        entry = None
+        while idle and entry is None:
+            instance, created = idle.pop()
+            self._size -= 1
+            if now - created <= self.ttl:
+                entry = (instance, created)
+            else:
+                self.expirations += 1
+        if idle:
+            self._idle.move_to_end(key)
+        else:
+            self._idle.pop(key, None)
+        return entry
+
+    def _release(self, key, entry):
+        if self.max_size <= 0 or time.monotonic() - entry[1] > self.ttl:
+            return
+        self._idle.setdefault(key, []).append(entry)
+        self._idle.move_to_end(key)
+        self._size += 1
+        while self._size > self.max_size:
+            oldest_key, idle = next(iter(self._idle.items()))
+            idle.pop(0)
+            self._size -= 1
+            self.evictions += 1
+            if not idle:
+                del self._idle[oldest_key]
+
+
+class AsyncTTLCache:
+    """Async TTL cache with negative caching and single-flight loading.
+
+    Concurrent misses for the same key share one in-flight load, so a burst of
+    jobs for one scorecard triggers a single lookup. Falsy results are cached for
+    negative_ttl; exceptions are never cached.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, max_size: int):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "size": len(self._entries),
+            "pending": len(self._pending),
+        }
+
+    async def get_or_load(self, key, loader):
+        """Return the cached value for key, calling loader() at most once per miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                if value:
+                    self.hits += 1
+                else:
+                    self.negative_hits += 1
+                return value
+            del self._entries[key]
+
+        task = self._pending.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._pending[key] = task
+        # Shield so one cancelled waiter does not cancel the load for everyone else
+        return await asyncio.shield(task)
+
+    async def _load(self, key, loader):
+        try:
+            value = await loader()
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._pending.pop(key, None)
+        ttl = self.ttl if value else self.negative_ttl
+        if ttl > 0 and self.max_size > 0:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+
+class ResultCache:
+    """Content-addressed store of score results in a local SQLite file.
+
+    Keys are built by key_for() from the score ID, score version, text and metadata,
+    so only identical inputs to the same score version share a result. Entries expire
+    after ttl seconds; past max_entries the least recently used are evicted. Methods
+    are blocking and meant to be called through run_blocking.
+    """
+
+    def __init__(self, path: str, ttl: float, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+        self.unversioned = 0
+        self._lock = Lock()
+        # Several supervised processes may share the file; WAL lets readers and the
+        # single writer proceed concurrently.
+        self._db = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_used_at ON results (used_at)")
+
+    @staticmethod
+    def key_for(score_id: str, score_version, text: str, metadata) -> str:
+        if isinstance(metadata, LazyJSONDict):
+            # Hash the undecoded values rather than forcing every key to be parsed
+            metadata = dict(metadata.raw_items())
+        material = json.dumps(
+            [score_id, score_version, text, metadata],
+            sort_keys=True,
+            default=lambda value: float(value) if isinstance(value, Decimal) else str(value),
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "unversioned": self.unversioned,
+        }
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT result, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            result, created_at = row
+            if now - created_at > self.ttl:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE results SET used_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return JSON_CODEC.decode(result)
+
+    def put(self, key: str, result: dict):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, result, created_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, JSON_CODEC.encode(result).decode(), now, now),
+            )
+            self.stores += 1
+            if self.stores % 100 == 0:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        self.expirations += self._db.execute(
+            "DELETE FROM results WHERE created_at < ?", (now - self.ttl,)
+        ).rowcount
+        excess = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self.evictions += self._db.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used_at LIMIT ?)",
+                (excess,),
+            ).rowcount
+
+
+class BatchLoader:
+    """DataLoader-style batching of individual key lookups.
+
+    Keys requested within window seconds (or until max_batch_size keys are queued)
+    are handed to batch_fn together. batch_fn receives a list of unique keys and
+    returns a dict of key -> value; missing keys resolve to None. A failed batch
+    fails every waiter in it. A window of 0 disables batching of separate load()
+    calls; load_many() always hands its keys over together.
+    """
+
+    def __init__(self, batch_fn, max_batch_size: int, window: float):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.window = window
+        self.batches = 0
+        self.keys = 0
+        self.largest_batch = 0
+        self._queue = {}
+        self._timer = None
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "keys": self.keys,
+            "largest_batch": self.largest_batch,
+            "queued": len(self._queue),
+        }
+
+    async def load(self, key):
+        future = self._queue.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._queue[key] = future
+            if len(self._queue) >= self.max_batch_size or self.window <= 0:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: list) -> list:
+        """Load keys as one batch (split at max_batch_size) without waiting out the
+        window. Returns one value, or the exception that failed it, per key."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for key in keys:
+            future = self._queue.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._queue[key] = future
+                if len(self._queue) >= self.max_batch_size:
+                    self._dispatch()
+            futures.append(future)
+        self._dispatch()
+        return await asyncio.gather(*(asyncio.shield(future) for future in futures), return_exceptions=True)
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, {}
+        if batch:
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: dict):
+        self.batches += 1
+        self.keys += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+
+def _get_many_by_id(model, ids: list, client) -> dict:
+    """Fetch several records of a Plexus model in one GraphQL request using aliases."""
+    if len(ids) == 1:
+        return {ids[0]: model.get_by_id(ids[0], client)}
+    name = model.__name__
+    declarations = ", ".join(f"$id{i}: ID!" for i in range(len(ids)))
+    selections = "\n".join(
+        f"k{i}: get{name}(id: $id{i}) {{ {model.fields()} }}" for i in range(len(ids))
+    )
+    query = f"query BatchGet{name}({declarations}) {{\n{selections}\n}}"
+    result = client.execute(query, {f"id{i}": id_ for i, id_ in enumerate(ids)})
+    return {
+        id_: model.from_dict(result[f"k{i}"], client) if result.get(f"k{i}") else None
+        for i, id_ in enumerate(ids)
+    }
+
+
+class JobStatusWriter:
+    """Write-behind queue for ScoringJob status updates.
+
+    Updates are merged per job while they wait: a later or terminal status replaces
+    an earlier one (IN_PROGRESS is skipped once COMPLETED is pending) and their
+    fields are combined, so startedAt still reaches the record. Pending updates are
+    written in batches by a background task; close() flushes everything left.
+    """
+
+    STATUS_RANK = {'IN_PROGRESS': 0, 'COMPLETED': 1, 'FAILED': 1}
+
+    def __init__(self, interval: float, batch_size: int):
+        self.interval = interval
+        self.batch_size = max(1, batch_size)
+        self.submitted = 0
+        self.merged = 0
+        self.written = 0
+        self.failed = 0
+        self._pending = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "merged": self.merged,
+            "written": self.written,
+            "failed": self.failed,
+            "pending": len(self._pending),
+        }
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, scoring_job, status: str, **kwargs):
+        self.submitted += 1
+        pending = self._pending.get(scoring_job.id)
+        if pending is None:
+            self._pending[scoring_job.id] = (scoring_job, {"status": status, **kwargs})
+        else:
+            self.merged += 1
+            _job, fields = pending
+            previous = fields["status"]
+            fields.update(kwargs)
+            if self.STATUS_RANK.get(status, 0) >= self.STATUS_RANK.get(previous, 0):
+                fields["status"] = status
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def close(self):
+        """Stop the background task after every pending update has been written."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+        else:
+            while self._pending:
+                await self._flush()
+
+    async def _run(self):
+        while not (self._closing and not self._pending):
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._pending:
+                await self._flush()
+                if not self._closing and len(self._pending) < self.batch_size:
+                    break
+
+    async def _flush(self):
+        batch = []
+        while self._pending and len(batch) < self.batch_size:
+            batch.append(self._pending.popitem(last=False)[1])
+        results = await asyncio.gather(
+            *(self._write(scoring_job, fields) for scoring_job, fields in batch),
+            return_exceptions=True,
+        )
+        for (scoring_job, fields), result in zip(batch, results):
+            if isinstance(result, Exception):
+                self.failed += 1
+                logging.error(
+                    "Failed to write ScoringJob status",
+                    extra={"scoring_job_id": scoring_job.id, "status": fields["status"]},
+                    exc_info=result,
+                )
+            else:
+                self.written += 1
+
+    async def _write(self, scoring_job, fields: dict):
+        started = time.monotonic()
+        await run_blocking("scoring_job.update", scoring_job.update, **fields)
+        STAGE_SECONDS.observe(time.monotonic() - started, "status_update")
+
+
+class StageGraph:
+    """Runs named async stages concurrently as soon as their dependencies have finished.
+
+    Each stage is called with the results of its dependencies, in the order they were
+    listed. Dependencies must be added before the stages that use them. If any stage
+    fails, the remaining stages are cancelled and the first error is raised.
+    """
+
+    def __init__(self):
+        self._stages = {}
+        self.durations = {}
+        self.elapsed = 0.0
+
+    def add(self, name: str, fn, *deps: str):
+        for dep in deps:
+            if dep not in self._stages:
+                raise ValueError(f"Stage {name} depends on unknown stage {dep}")
+        self._stages[name] = (fn, deps)
+
+    async def run(self) -> dict:
+        started = time.monotonic()
+        tasks = {}
+        for name, (fn, deps) in self._stages.items():
+            tasks[name] = asyncio.ensure_future(
+                self._run_stage(name, fn, [tasks[dep] for dep in deps])
+            )
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self.elapsed = time.monotonic() - started
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _run_stage(self, name: str, fn, deps: list):
+        args = [await dep for dep in deps]
+        started = time.monotonic()
+        try:
+            return await fn(*args)
+        finally:
+            self.durations[name] = time.monotonic() - started
+
+
 class RabbitMQJobProcessor:
     """Processes scoring jobs pulled from RabbitMQ."""
 
@@ -146,6 +1733,81 @@ class RabbitMQJobProcessor:
         self.account_id = None
         self.account_key = os.environ.get('PLEXUS_ACCOUNT_KEY')
         self.scoring_mode = os.environ.get('PLEXUS_SCORING_MODE', 'real').lower()
+        self.mock_delay = float(os.environ.get('PLEXUS_MOCK_DELAY_MS', 0)) / 1000
+        self.mock_fail_job_ids = {
+            id_.strip() for id_ in os.environ.get('PLEXUS_MOCK_FAIL_JOB_IDS', '').split(',') if id_.strip()
+        }
+        self.scorecard_cache = ScorecardInstanceCache(
+            self._build_scorecard_instance,
+            max_size=int(os.environ.get('PLEXUS_SCORECARD_CACHE_SIZE', DEFAULT_SCORECARD_CACHE_SIZE)),
+            ttl=float(os.environ.get(
+                'PLEXUS_SCORECARD_CACHE_TTL_SECONDS', DEFAULT_SCORECARD_CACHE_TTL_SECONDS
+            )),
+        )
+        self.lookup_cache = AsyncTTLCache(
+            ttl=float(os.environ.get('PLEXUS_LOOKUP_CACHE_TTL_SECONDS', DEFAULT_LOOKUP_CACHE_TTL_SECONDS)),
+            negative_ttl=float(os.environ.get(
+                'PLEXUS_LOOKUP_CACHE_NEGATIVE_TTL_SECONDS', DEFAULT_LOOKUP_CACHE_NEGATIVE_TTL_SECONDS
+            )),
+            max_size=int(os.environ.get('PLEXUS_LOOKUP_CACHE_SIZE', DEFAULT_LOOKUP_CACHE_SIZE)),
+        )
+        self.batch_window_configured = 'PLEXUS_BATCH_LOADER_WINDOW_MS' in os.environ
+        batch_window = float(os.environ.get(
+            'PLEXUS_BATCH_LOADER_WINDOW_MS', DEFAULT_BATCH_LOADER_WINDOW_MS
+        )) / 1000
+        batch_max_keys = int(os.environ.get('PLEXUS_BATCH_LOADER_MAX_KEYS', DEFAULT_BATCH_LOADER_MAX_KEYS))
+        self.metadata_decoding = os.environ.get('PLEXUS_METADATA_DECODING', DEFAULT_METADATA_DECODING).lower()
+        self.scoring_job_loader = BatchLoader(
+            lambda ids: self._load_many('plexus.dashboard.api.models.scoring_job', 'ScoringJob', ids),
+            max_batch_size=batch_max_keys,
+            window=batch_window,
+        )
+        self.item_loader = BatchLoader(
+            lambda ids: self._load_many('plexus.dashboard.api.models.item', 'Item', ids),
+            max_batch_size=batch_max_keys,
+            window=batch_window,
+        )
+        self.result_cache = None
+        result_cache_path = os.environ.get('PLEXUS_RESULT_CACHE_PATH')
+        if result_cache_path:
+            self.result_cache = ResultCache(
+                result_cache_path,
+                ttl=float(os.environ.get('PLEXUS_RESULT_CACHE_TTL_SECONDS', DEFAULT_RESULT_CACHE_TTL_SECONDS)),
+                max_entries=int(os.environ.get(
+                    'PLEXUS_RESULT_CACHE_MAX_ENTRIES', DEFAULT_RESULT_CACHE_MAX_ENTRIES
+                )),
+            )
+        self.request_logs = RequestLogCapture(
+            mode=os.environ.get('PLEXUS_REQUEST_LOG_CAPTURE', DEFAULT_REQUEST_LOG_CAPTURE).lower(),
+            sample_rate=float(os.environ.get('PLEXUS_REQUEST_LOG_SAMPLE_RATE', DEFAULT_REQUEST_LOG_SAMPLE_RATE)),
+            buffer_size=int(os.environ.get('PLEXUS_REQUEST_LOG_BUFFER', DEFAULT_REQUEST_LOG_BUFFER)),
+            sinks={
+                sink.strip().lower()
+                for sink in os.environ.get('PLEXUS_REQUEST_LOG_SINKS', DEFAULT_REQUEST_LOG_SINKS).split(',')
+            },
+            directory=os.environ.get('PLEXUS_REQUEST_LOG_DIR', DEFAULT_REQUEST_LOG_DIR),
+            max_files=int(os.environ.get('PLEXUS_REQUEST_LOG_MAX_FILES', DEFAULT_REQUEST_LOG_MAX_FILES)),
+        )
+        self.batch_concurrency = int(os.environ.get('PLEXUS_BATCH_CONCURRENCY', DEFAULT_BATCH_CONCURRENCY))
+        self.status_writer = None
+        status_mode = os.environ.get('PLEXUS_STATUS_UPDATE_MODE', DEFAULT_STATUS_UPDATE_MODE).lower()
+        if status_mode == 'write_behind':
+            self.status_writer = JobStatusWriter(
+                interval=float(os.environ.get(
+                    'PLEXUS_STATUS_FLUSH_INTERVAL_MS', DEFAULT_STATUS_FLUSH_INTERVAL_MS
+                )) / 1000,
+                batch_size=int(os.environ.get(
+                    'PLEXUS_STATUS_FLUSH_BATCH_SIZE', DEFAULT_STATUS_FLUSH_BATCH_SIZE
+                )),
+            )
+
+    def configure_concurrency(self, max_in_flight: int):
+        """Turn off the default batching window when at most one message is ever in
+        flight: separate jobs cannot meet in a batch, and every fetch would wait out the
+        window. Batch requests still batch, since they load all their IDs at once."""
+        if max_in_flight <= 1 and not self.batch_window_configured:
+            self.scoring_job_loader.window = 0.0
+            self.item_loader.window = 0.0
 
     async def initialize(self):
         if self.scoring_mode == 'mock':
@@ -157,27 +1819,171 @@ class RabbitMQJobProcessor:
 
         self.client = PlexusDashboardClient()
         logging.info(f"Resolving account: {self.account_key}")
-        account = await asyncio.to_thread(Account.get_by_key, self.account_key, self.client)
+        account = await run_blocking(
+            "account.get_by_key", Account.get_by_key, self.account_key, self.client
+        )
         if not account:
             raise ValueError(f"No account found with key: {self.account_key}")
         self.account_id = account.id
         logging.info(f"Initialized with account: {account.name} (ID: {self.account_id})")
+        await self._warm_up()
+        if self.status_writer is not None:
+            self.status_writer.start()
+            logging.info("Status updates: write-behind")
+
+    async def _warm_up(self):
+        """Pay import, tokenizer and hot-scorecard setup costs before reporting ready."""
+        started = time.monotonic()
+        preload_modules()
+
+        built = 0
+        for entry in os.environ.get('PLEXUS_WARMUP_SCORECARDS', '').split(','):
+            if not entry.strip():
+                continue
+            scorecard_key, _, score_key = entry.strip().partition(':')
+            if not scorecard_key or not score_key:
+                logging.warning(f"Ignoring invalid PLEXUS_WARMUP_SCORECARDS entry: {entry.strip()}")
+                continue
+            try:
+                instance_key = await self._warmup_instance_key(scorecard_key, score_key)
+                async with self.scorecard_cache.acquire(instance_key):
+                    built += 1
+            except Exception:
+                logging.warning(
+                    "Failed to pre-build scorecard during warm-up",
+                    extra={"scorecard": scorecard_key, "score": score_key},
+                    exc_info=True,
+                )
 
-    async def process_scoring_job(self, scoring_job_id: str, request_id: str) -> dict:
+        logging.info(
+            "Warm-up complete",
+            extra={
+                "duration_seconds": round(time.monotonic() - started, 3),
+                "scorecards_built": built,
+            },
+        )
+
+    async def _warmup_instance_key(self, scorecard_key, score_key) -> tuple:
+        """Instance pool key a job for this scorecard and score will use."""
+        if self.result_cache is None:
+            return (scorecard_key, score_key, None)
+        from plexus.dashboard.api.models.score import Score
+        from plexus.utils.scoring import resolve_score_id, resolve_scorecard_id
+
+        scorecard_id = await self._resolve_scorecard_id(scorecard_key, resolve_scorecard_id)
+        score_id = await self._resolve_score_id(score_key, scorecard_id, resolve_score_id)
+        return (scorecard_key, score_key, await self._fetch_score_version(score_id, Score))
+
+    async def close(self):
+        """Flush any bookkeeping still queued in the background."""
+        if self.status_writer is not None:
+            await self.status_writer.close()
+            logging.info("Flushed pending status updates", extra=self.status_writer.stats())
+
+    async def process_scoring_job(self, scoring_job_id: str, request_id: str, admission=None) -> dict:
+        """Score one job. admission(scoring_job) may return an async context manager that
+        gates everything after the ScoringJob fetch (e.g. a per-scorecard bulkhead)."""
+        with self.request_logs.capture() as captured:
+            try:
+                logging.info(f"Processing scoring_job_id={scoring_job_id} request_id={request_id}")
+
+                started = time.monotonic()
+                scoring_job = await self._fetch_scoring_job(scoring_job_id)
+                STAGE_SECONDS.observe(time.monotonic() - started, "scoring_job")
+
+                async with (admission(scoring_job) if admission is not None else nullcontext()):
+                    return await self._score_job(scoring_job, request_id)
+            except BulkheadFull:
+                raise
+            except Exception as e:
+                await self.request_logs.on_failure(request_id, captured, e)
+                raise
+
+    async def process_scoring_jobs(self, scoring_job_ids: list, request_id: str, admission=None,
+                                   retryable=None) -> list:
+        """Score a batch of jobs for one scorecard and score.
+
+        Returns one entry per ID, in order: {"scoring_job_id", "status": "success",
+        "value", "explanation", "cost", "cached"} or {"scoring_job_id", "status": "error",
+        "error"}, plus "logs" when request log capture attaches them. A failure for which
+        retryable(exc) is true gets "status": "retried" instead, for the caller to
+        re-enqueue.
+
+        The batch is admitted like a single job, using its first job, so a full bulkhead
+        requeues it before any work is done. Along with that slot it takes whichever of
+        its scorecard's own slots are free at that moment, up to batch_concurrency in
+        all, and scores that many jobs at a time. It never waits for a slot while
+        holding one, so two batches (or one batch at a limit of 1) cannot deadlock.
+        """
+        logging.info(f"Processing batch of {len(scoring_job_ids)} scoring jobs request_id={request_id}")
+
+        started = time.monotonic()
+        scoring_jobs = await self._fetch_scoring_jobs(scoring_job_ids)
+        STAGE_SECONDS.observe(time.monotonic() - started, "scoring_job")
+        first = next((job for job in scoring_jobs if not isinstance(job, BaseException)), None)
+        concurrency = max(1, min(self.batch_concurrency, len(scoring_job_ids)))
+
+        async def score(scoring_job_id, scoring_job, semaphore, items):
+            if isinstance(scoring_job, BaseException):
+                raise scoring_job
+            if (scoring_job.scorecardId, scoring_job.scoreId) != (first.scorecardId, first.scoreId):
+                raise ValueError(
+                    f"ScoringJob {scoring_job.id} is for a different scorecard or score than the batch"
+                )
+            async with semaphore:
+                with self.request_logs.capture() as captured:
+                    try:
+                        return await self._score_job(scoring_job, request_id, items)
+                    except Exception as e:
+                        await self.request_logs.on_failure(f"{request_id}.{scoring_job_id}", captured, e)
+                        raise
+
+        if admission is not None and first is not None:
+            admit = admission(first, extra=concurrency - 1)
+        else:
+            admit = nullcontext(concurrency - 1)
+        async with admit as extra:
+            semaphore = asyncio.Semaphore(1 + extra)
+            items = await self._fetch_items([
+                scoring_job.itemId for scoring_job in scoring_jobs if not isinstance(scoring_job, BaseException)
+            ])
+            outcomes = await asyncio.gather(
+                *(score(scoring_job_id, scoring_job, semaphore, items)
+                  for scoring_job_id, scoring_job in zip(scoring_job_ids, scoring_jobs)),
+                return_exceptions=True,
+            )
+
+        results = []
+        for scoring_job_id, outcome in zip(scoring_job_ids, outcomes):
+            if isinstance(outcome, Exception):
+                status = "retried" if retryable is not None and retryable(outcome) else "error"
+                logging.warning(
+                    "Batch item failed",
+                    extra={
+                        "request_id": request_id,
+                        "scoring_job_id": scoring_job_id,
+                        "error": str(outcome),
+                        "retried": status == "retried",
+                    },
+                )
+                entry = {"scoring_job_id": scoring_job_id, "status": status, "error": str(outcome)}
+                if getattr(outcome, "request_logs", None) is not None:
+                    entry["logs"] = outcome.request_logs
+                results.append(entry)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append({"scoring_job_id": scoring_job_id, "status": "success", **outcome})
+        return results
+
+    async def _score_job(self, scoring_job, request_id: str, items: dict = None) -> dict:
+        """Prepare and score one job. items holds Items a batch already loaded, by ID."""
         if self.scoring_mode == 'mock':
-            return {
-                "value": "mock",
-                "explanation": f"mock scoring for {scoring_job_id}",
-                "cost": None,
-            }
+            return await self._mock_score(scoring_job)
 
-        from plexus.dashboard.api.models.item import Item
         from plexus.dashboard.api.models.score import Score
         from plexus.dashboard.api.models.scorecard import Scorecard
-        from plexus.dashboard.api.models.scoring_job import ScoringJob
-        from plexus.utils.request_log_capture import capture_request_logs
         from plexus.utils.scoring import (
-            create_scorecard_instance_for_single_score,
             get_external_id_from_item,
             get_metadata_from_item,
             get_text_from_item,
@@ -185,106 +1991,294 @@ class RabbitMQJobProcessor:
             resolve_scorecard_id,
         )
 
-        with capture_request_logs(request_id) as (_req_id, get_logs):
-            logging.info(f"Processing scoring_job_id={scoring_job_id} request_id={request_id}")
-
-            scoring_job = await asyncio.to_thread(ScoringJob.get_by_id, scoring_job_id, self.client)
-            if not scoring_job:
-                raise ValueError(f"ScoringJob not found: {scoring_job_id}")
-
-            await self._update_job_status(scoring_job, 'IN_PROGRESS', startedAt=_utcnow())
-
-            scorecard_external_id, score_external_id = await self._fetch_external_ids(
-                scoring_job, Scorecard, Score
-            )
-            dynamo_scorecard_id, dynamo_score_id = await self._resolve_ids(
-                scorecard_external_id, score_external_id, resolve_scorecard_id, resolve_score_id
-            )
+        graph = StageGraph()
+        graph.add(
+            "status_in_progress",
+            lambda: self._update_job_status(scoring_job, 'IN_PROGRESS', startedAt=_utcnow()),
+        )
+        graph.add(
+            "scorecard_external_id",
+            lambda: self._fetch_scorecard_external_id(scoring_job.scorecardId, Scorecard),
+        )
+        graph.add(
+            "score_external_id",
+            lambda: self._fetch_score_external_id(scoring_job.scoreId, Score),
+        )
+        graph.add(
+            "scorecard_id",
+            lambda scorecard_external_id: self._resolve_scorecard_id(
+                scorecard_external_id, resolve_scorecard_id
+            ),
+            "scorecard_external_id",
+        )
+        graph.add(
+            "score_id",
+            lambda score_external_id, dynamo_scorecard_id: self._resolve_score_id(
+                score_external_id, dynamo_scorecard_id, resolve_score_id
+            ),
+            "score_external_id", "scorecard_id",
+        )
+        graph.add("item", lambda: self._fetch_item(scoring_job.itemId, items))
+        graph.add(
+            "text",
+            lambda item: self._fetch_item_text(scoring_job.itemId, item, get_text_from_item),
+            "item",
+        )
+        graph.add(
+            "metadata",
+            lambda: self._fetch_item_metadata(scoring_job.itemId, get_metadata_from_item),
+        )
+        graph.add(
+            "external_id",
+            lambda: self._fetch_item_external_id(scoring_job.itemId, get_external_id_from_item),
+        )
+        if self.result_cache is not None:
+            graph.add("score_version", lambda: self._fetch_score_version(scoring_job.scoreId, Score))
+        prepared = await graph.run()
+        for stage, duration in graph.durations.items():
+            STAGE_SECONDS.observe(duration, stage)
+        STAGE_SECONDS.observe(graph.elapsed, "prepare")
+        logging.info(
+            "Job prepared",
+            extra={
+                "request_id": request_id,
+                "scoring_job_id": scoring_job.id,
+                "prepare_seconds": round(graph.elapsed, 4),
+                "stage_seconds": {k: round(v, 4) for k, v in graph.durations.items()},
+            },
+        )
 
-            transcript_text, metadata, external_id, item = await self._fetch_item_data(
-                scoring_job.itemId, Item, get_text_from_item, get_metadata_from_item,
-                get_external_id_from_item
+        scorecard_external_id = prepared["scorecard_external_id"]
+        score_external_id = prepared["score_external_id"]
+        dynamo_score_id = prepared["score_id"]
+        transcript_text = prepared["text"]
+        metadata = prepared["metadata"]
+        item = prepared["item"]
+
+        score_version = prepared.get("score_version")
+        result_key = None
+        if self.result_cache is not None and score_version is None:
+            # Without a version a config change could not invalidate the entry
+            self.result_cache.unversioned += 1
+            logging.info(
+                "Score has no champion version, not using the result cache",
+                extra={"request_id": request_id, "scoring_job_id": scoring_job.id},
             )
-
-            scorecard_instance = await create_scorecard_instance_for_single_score(
-                scorecard_external_id,
-                score_external_id,
+        elif self.result_cache is not None:
+            result_key = ResultCache.key_for(
+                dynamo_score_id, score_version, transcript_text or "", metadata
             )
-            if not scorecard_instance:
-                raise Exception(f"Failed to create scorecard instance for {scorecard_external_id}")
-
+            cached = await self._get_cached_result(result_key)
+            if cached is not None:
+                logging.info(
+                    "Result cache hit",
+                    extra={"request_id": request_id, "scoring_job_id": scoring_job.id},
+                )
+                await self._update_job_status(scoring_job, 'COMPLETED', completedAt=_utcnow())
+                return {**cached, "cached": True}
+
+        # The version partitions the instance pool, so a result stored under a version
+        # always comes from an instance built after that version was seen.
+        cache_key = (scorecard_external_id, score_external_id, score_version)
+        async with self.scorecard_cache.acquire(cache_key) as scorecard_instance:
+            score_started = time.monotonic()
             score_results = await scorecard_instance.score_entire_text(
                 text=transcript_text or "",
                 metadata=metadata,
                 modality="API",
                 item=item,
             )
+            STAGE_SECONDS.observe(time.monotonic() - score_started, "score")
+
+        value, explanation, cost = self._extract_result(score_results, dynamo_score_id)
 
-            value, explanation, cost = self._extract_result(score_results, dynamo_score_id)
+        if value and value.upper() == "ERROR":
+            error_msg = explanation[:255] if explanation else "Scoring returned ERROR"
+            await self._update_job_status(scoring_job, 'FAILED',
+                                          errorMessage=error_msg, completedAt=_utcnow())
+            raise ValueError(f"Scoring returned ERROR: {error_msg}")
 
-            if value and value.upper() == "ERROR":
-                error_msg = explanation[:255] if explanation else "Scoring returned ERROR"
-                await self._update_job_status(scoring_job, 'FAILED',
-                                              errorMessage=error_msg, completedAt=_utcnow())
-                raise ValueError(f"Scoring returned ERROR: {error_msg}")
+        result = {"value": value, "explanation": explanation, "cost": cost}
+        if result_key is not None:
+            await self._store_cached_result(result_key, result)
 
-            get_logs()
-            await self._update_job_status(scoring_job, 'COMPLETED', completedAt=_utcnow())
+        await self._update_job_status(scoring_job, 'COMPLETED', completedAt=_utcnow())
 
-            return {"value": value, "explanation": explanation, "cost": cost}
+        return {**result, "cached": False}
+
+    async def _mock_score(self, scoring_job) -> dict:
+        if self.mock_delay > 0:
+            await asyncio.sleep(self.mock_delay)
+        if scoring_job.id in self.mock_fail_job_ids:
+            raise ValueError(f"mock scoring failure for {scoring_job.id}")
+        return {
+            "value": "mock",
+            "explanation": f"mock scoring for {scoring_job.id}",
+            "cost": None,
+            "cached": False,
+        }
+
+    async def _get_cached_result(self, key: str):
+        try:
+            return await run_blocking("result_cache.get", self.result_cache.get, key)
+        except Exception:
+            self.result_cache.errors += 1
+            logging.warning("Result cache lookup failed", exc_info=True)
+            return None
+
+    async def _store_cached_result(self, key: str, result: dict):
+        try:
+            await run_blocking("result_cache.put", self.result_cache.put, key, result)
+        except Exception:
+            self.result_cache.errors += 1
+            logging.warning("Failed to store result in cache", exc_info=True)
+
+    async def _build_scorecard_instance(self, scorecard_external_id, score_external_id, score_version=None):
+        # score_version only keys the pool; the champion configuration is loaded here
+        from plexus.utils.scoring import create_scorecard_instance_for_single_score
+
+        scorecard_instance = await create_scorecard_instance_for_single_score(
+            scorecard_external_id,
+            score_external_id,
+        )
+        if not scorecard_instance:
+            raise Exception(f"Failed to create scorecard instance for {scorecard_external_id}")
+        return scorecard_instance
 
     async def _update_job_status(self, scoring_job, status: str, **kwargs):
-        await asyncio.to_thread(scoring_job.update, status=status, **kwargs)
+        if self.status_writer is not None:
+            self.status_writer.submit(scoring_job, status, **kwargs)
+            return
+        started = time.monotonic()
+        await run_blocking("scoring_job.update", scoring_job.update, status=status, **kwargs)
+        STAGE_SECONDS.observe(time.monotonic() - started, "status_update")
+
+    async def _load_many(self, module: str, model_name: str, ids: list) -> dict:
+        model = getattr(importlib.import_module(module), model_name)
+        call_site = module.rsplit('.', 1)[-1]
+        try:
+            return await run_blocking(
+                f"{call_site}.get_many_by_id", _get_many_by_id, model, ids, self.client
+            )
+        except Exception:
+            if len(ids) == 1:
+                raise
+            logging.warning(
+                f"Batched {model_name} fetch failed, falling back to individual fetches",
+                extra={"batch_size": len(ids)},
+                exc_info=True,
+            )
+        results = await asyncio.gather(
+            *(run_blocking(f"{call_site}.get_by_id", model.get_by_id, id_, self.client)
+              for id_ in ids)
+        )
+        return dict(zip(ids, results))
 
-    async def _fetch_external_ids(self, scoring_job, Scorecard, Score):
-        scorecard = await asyncio.to_thread(Scorecard.get_by_id, scoring_job.scorecardId, self.client)
-        scorecard_external_id = scorecard.externalId if scorecard else None
+    async def _fetch_scoring_job(self, scoring_job_id):
+        if self.scoring_mode == 'mock':
+            # '<scorecard>:<id>' puts a mock job on that scorecard, for bulkhead tests
+            scorecard_id, _, _ = scoring_job_id.rpartition(':')
+            return SimpleNamespace(
+                id=scoring_job_id,
+                scorecardId=scorecard_id or "mock-scorecard",
+                scoreId="mock-score",
+                itemId=scoring_job_id,
+            )
+        scoring_job = await self.scoring_job_loader.load(scoring_job_id)
+        if not scoring_job:
+            raise ValueError(f"ScoringJob not found: {scoring_job_id}")
+        return scoring_job
+
+    async def _fetch_scoring_jobs(self, scoring_job_ids: list) -> list:
+        """Fetch a batch's ScoringJobs together. Each entry is the job, or the exception
+        for that ID."""
+        if self.scoring_mode == 'mock':
+            return [await self._fetch_scoring_job(scoring_job_id) for scoring_job_id in scoring_job_ids]
+        loaded = await self.scoring_job_loader.load_many(scoring_job_ids)
+        return [
+            scoring_job if scoring_job else ValueError(f"ScoringJob not found: {scoring_job_id}")
+            for scoring_job_id, scoring_job in zip(scoring_job_ids, loaded)
+        ]
+
+    async def _fetch_items(self, item_ids: list) -> dict:
+        """Fetch a batch's Items together. IDs whose fetch failed are left out, so their
+        jobs fetch them again on their own."""
+        if self.scoring_mode == 'mock' or not item_ids:
+            return {}
+        loaded = await self.item_loader.load_many(item_ids)
+        return {
+            item_id: item for item_id, item in zip(item_ids, loaded) if not isinstance(item, BaseException)
+        }
+
+    async def _fetch_scorecard_external_id(self, scorecard_id, Scorecard):
+        scorecard = await self.lookup_cache.get_or_load(
+            ("scorecard", scorecard_id),
+            lambda: run_blocking("scorecard.get_by_id", Scorecard.get_by_id, scorecard_id, self.client),
+        )
+        return scorecard.externalId if scorecard else None
 
-        score = await asyncio.to_thread(Score.get_by_id, scoring_job.scoreId, self.client)
-        score_external_id = score.externalId if score else None
+    async def _fetch_score_external_id(self, score_id, Score):
+        score = await self.lookup_cache.get_or_load(
+            ("score", score_id),
+            lambda: run_blocking("score.get_by_id", Score.get_by_id, score_id, self.client),
+        )
+        return score.externalId if score else None
 
-        return scorecard_external_id, score_external_id
+    async def _fetch_score_version(self, score_id, Score):
+        score = await self.lookup_cache.get_or_load(
+            ("score", score_id),
+            lambda: run_blocking("score.get_by_id", Score.get_by_id, score_id, self.client),
+        )
+        return getattr(score, 'championVersionId', None) if score else None
 
-    async def _resolve_ids(self, scorecard_external_id, score_external_id,
-                           resolve_scorecard_id, resolve_score_id):
-        dynamo_scorecard_id = await resolve_scorecard_id(
-            scorecard_external_id, self.account_id, self.client
+    async def _resolve_scorecard_id(self, scorecard_external_id, resolve_scorecard_id):
+        dynamo_scorecard_id = await self.lookup_cache.get_or_load(
+            ("scorecard_id", scorecard_external_id, self.account_id),
+            lambda: resolve_scorecard_id(scorecard_external_id, self.account_id, self.client),
         )
         if not dynamo_scorecard_id:
             raise Exception(f"Could not resolve scorecard ID: {scorecard_external_id}")
+        return dynamo_scorecard_id
 
-        resolved_score_info = await resolve_score_id(
-            score_external_id, dynamo_scorecard_id, self.client
+    async def _resolve_score_id(self, score_external_id, dynamo_scorecard_id, resolve_score_id):
+        resolved_score_info = await self.lookup_cache.get_or_load(
+            ("score_id", score_external_id, dynamo_scorecard_id),
+            lambda: resolve_score_id(score_external_id, dynamo_scorecard_id, self.client),
         )
         if not resolved_score_info:
             raise Exception(f"Could not resolve score ID: {score_external_id}")
+        return resolved_score_info['id']
 
-        return dynamo_scorecard_id, resolved_score_info['id']
+    async def _fetch_item(self, item_id, items: dict = None):
+        if items and item_id in items:
+            return items[item_id]
+        return await self.item_loader.load(item_id)
 
-    async def _fetch_item_data(self, item_id, Item, get_text_from_item,
-                               get_metadata_from_item, get_external_id_from_item):
-        item = await asyncio.to_thread(Item.get_by_id, item_id, self.client)
+    async def _fetch_item_text(self, item_id, item, get_text_from_item):
         transcript_text = (
             item.text if item and item.text
             else await get_text_from_item(item_id, self.client)
         )
         if not transcript_text:
             raise Exception(f"No transcript found for item {item_id}")
+        return transcript_text
 
+    async def _fetch_item_metadata(self, item_id, get_metadata_from_item):
         metadata = await get_metadata_from_item(item_id, self.client) or {}
-        if isinstance(metadata, dict):
-            for key, value in list(metadata.items()):
-                if isinstance(value, str):
-                    try:
-                        metadata[key] = json.loads(value)
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-
+        if not isinstance(metadata, dict):
+            return metadata
+        if self.metadata_decoding == 'lazy':
+            # JSON-encoded values are decoded when the scorecard first reads them
+            return LazyJSONDict(metadata)
+        # A plain dict: checkpoint serializers read a dict's storage directly and would
+        # see a LazyJSONDict's unread values as JSON strings
+        return LazyJSONDict(metadata).decoded()
+
+    async def _fetch_item_external_id(self, item_id, get_external_id_from_item):
         external_id = await get_external_id_from_item(item_id, self.client)
         if not external_id:
             raise Exception(f"No external_id found for item {item_id}")
-
-        return transcript_text, metadata, external_id, item
+        return external_id
 
     def _extract_result(self, score_results: dict, dynamo_score_id: str):
         result = score_results.get(dynamo_score_id)
@@ -296,11 +2290,477 @@ class RabbitMQJobProcessor:
             getattr(result, 'explanation', None)
             or (result.metadata.get('explanation', '') if result.metadata else '')
         )
-        cost = _json_safe(result.metadata.get('cost')) if result.metadata else None
+        cost = result.metadata.get('cost') if result.metadata else None
 
         return value, explanation, cost
 
 
+def is_retryable(exc: BaseException) -> bool:
+    """True if exc, or anything in its cause chain, looks like a transient failure."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (ConnectionError, TimeoutError)):
+            return True
+        if type(exc).__name__ in RETRYABLE_ERROR_NAMES:
+            return True
+        status = getattr(exc, "status_code", None) or getattr(
+            getattr(exc, "response", None), "status_code", None
+        )
+        if status in RETRYABLE_STATUS_CODES:
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class RetryPolicy:
+    """Delayed retries through per-attempt dead-letter queues, then a parking queue.
+
+    Attempt n waits in `<queue>.retry.<n>`, declared with an x-message-ttl of the
+    attempt's full backoff and dead-lettering back to the request queue. Each message
+    gets a jittered expiration within that TTL, so retries of a burst of failures are
+    spread out, and since every message in a tier has a similar delay, head-of-line
+    blocking is bounded by the jitter. Messages that fail fatally or run out of
+    attempts go to `<queue>.parked`.
+    """
+
+    def __init__(self, queue_name: str, max_attempts: int, base_delay: float, max_delay: float):
+        self.queue_name = queue_name
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.parking_queue = f"{queue_name}.parked"
+        self.retried = 0
+        self.parked = 0
+
+    def stats(self) -> dict:
+        return {"max_attempts": self.max_attempts, "retried": self.retried, "parked": self.parked}
+
+    def tier_queue(self, attempt: int) -> str:
+        return f"{self.queue_name}.retry.{attempt}"
+
+    def backoff(self, attempt: int) -> float:
+        return min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+    def delay(self, attempt: int) -> float:
+        backoff = self.backoff(attempt)
+        return random.uniform(backoff / 2, backoff)
+
+    async def declare(self, channel):
+        for attempt in range(1, self.max_attempts + 1):
+            await channel.declare_queue(
+                self.tier_queue(attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": int(self.backoff(attempt) * 1000),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue_name,
+                },
+            )
+        await channel.declare_queue(self.parking_queue, durable=True)
+
+
+def _current_rss_bytes() -> int:
+    """Resident set size of this process; peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ReconnectBackoff:
+    """Exponential backoff with full jitter between RabbitMQ connection attempts.
+
+    Attempt n sleeps a uniform random time up to min(max_delay, base_delay * 2**(n-1)),
+    so replicas that lost the same broker spread their reconnects out instead of
+    arriving together. Also measures each outage, from the connection loss until
+    consuming resumes; failures before the first connection are not counted as one.
+    """
+
+    def __init__(self, base_delay: float, max_delay: float):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempt = 0
+        self.connections = 0
+        self.reconnects = 0
+        self.outage_started = None
+        self.last_outage_seconds = None
+
+    def stats(self) -> dict:
+        return {
+            "reconnects": self.reconnects,
+            "failed_attempts": self.attempt,
+            "disconnected_seconds": (
+                round(time.monotonic() - self.outage_started, 3) if self.outage_started is not None else 0.0
+            ),
+            "last_outage_seconds": self.last_outage_seconds,
+        }
+
+    def disconnected(self):
+        if self.outage_started is None:
+            self.outage_started = time.monotonic()
+
+    def next_delay(self) -> float:
+        self.attempt += 1
+        CONNECT_FAILURES_TOTAL.inc()
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (self.attempt - 1)))
+
+    def connected(self):
+        """Reset the backoff; returns the outage duration if this ended one."""
+        self.attempt = 0
+        self.connections += 1
+        started, self.outage_started = self.outage_started, None
+        if started is None or self.connections == 1:
+            return None
+        duration = time.monotonic() - started
+        self.last_outage_seconds = round(duration, 3)
+        self.reconnects += 1
+        RECONNECTS_TOTAL.inc()
+        OUTAGE_SECONDS.observe(duration)
+        return duration
+
+
+class RecyclePolicy:
+    """Decides when a long-lived worker should drain and exit to release memory.
+
+    Tracks RSS around every job. The job limit is jittered down by up to 10% per
+    process so that workers started together do not all recycle at once.
+    """
+
+    def __init__(self, max_jobs: int, max_rss_bytes: int):
+        self.max_jobs = int(max_jobs * random.uniform(0.9, 1.0)) if max_jobs > 0 else 0
+        self.max_rss_bytes = max_rss_bytes
+        self.jobs = 0
+        self.rss_bytes = _current_rss_bytes()
+        self.peak_rss_bytes = self.rss_bytes
+        self.started_rss_bytes = self.rss_bytes
+        self.largest_job_growth_bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_jobs > 0 or self.max_rss_bytes > 0
+
+    def stats(self) -> dict:
+        return {
+            "jobs": self.jobs,
+            "max_jobs": self.max_jobs,
+            "rss_mb": round(self.rss_bytes / 2**20, 1),
+            "peak_rss_mb": round(self.peak_rss_bytes / 2**20, 1),
+            "rss_growth_mb": round((self.rss_bytes - self.started_rss_bytes) / 2**20, 1),
+            "largest_job_growth_mb": round(self.largest_job_growth_bytes / 2**20, 1),
+            "max_rss_mb": round(self.max_rss_bytes / 2**20, 1),
+        }
+
+    def record_job(self, rss_before: int):
+        """Account one finished job; returns the reason to recycle, if any.
+
+        With concurrent jobs the per-job growth also includes the others' allocations,
+        so it is an upper bound.
+        """
+        self.jobs += 1
+        self.rss_bytes = _current_rss_bytes()
+        self.peak_rss_bytes = max(self.peak_rss_bytes, self.rss_bytes)
+        self.largest_job_growth_bytes = max(self.largest_job_growth_bytes, self.rss_bytes - rss_before)
+        if self.max_rss_bytes > 0 and self.rss_bytes >= self.max_rss_bytes:
+            return "max_rss"
+        if self.max_jobs > 0 and self.jobs >= self.max_jobs:
+            return "max_jobs"
+        return None
+
+
+class BulkheadFull(Exception):
+    """Raised when a job's bulkhead and the shared overflow pool are both full."""
+
+
+class Bulkheads:
+    """Per-scorecard (or per-score) in-flight limits with a shared overflow pool.
+
+    A job takes a slot from its key's own allowance first, then from the overflow
+    pool. When both are full it waits up to `hold` seconds for a slot to free up and
+    then raises BulkheadFull, so the message can go back to the queue instead of
+    tying up the prefetch slots every other scorecard needs. A batch can ask for up to
+    `extra` further slots: it gets those of its key's own allowance that are free at
+    that moment, never waits for them, and leaves the overflow pool to other keys.
+    """
+
+    def __init__(self, default_limit: int, limits: dict, overflow: int, hold: float, key: str):
+        self.default_limit = default_limit
+        self.limits = limits
+        self.overflow = overflow
+        self.hold = hold
+        self.key = key
+        self.occupancy = {}
+        self.overflow_in_use = 0
+        self.rejected = {}
+        self._released = asyncio.Condition()
+
+    @classmethod
+    def parse_limits(cls, raw: str) -> dict:
+        limits = {}
+        for entry in raw.split(','):
+            name, _, value = entry.strip().partition('=')
+            if name and value:
+                limits[name.strip()] = int(value)
+        return limits
+
+    def limit_for(self, key: str) -> int:
+        return self.limits.get(key, self.default_limit)
+
+    def key_for(self, scoring_job) -> str:
+        return scoring_job.scoreId if self.key == 'score' else scoring_job.scorecardId
+
+    def stats(self) -> dict:
+        # Called from the health server thread while the loop updates both dicts
+        return {
+            "overflow_in_use": self.overflow_in_use,
+            "overflow_size": self.overflow,
+            "occupancy": {
+                key: {"in_flight": count, "limit": self.limit_for(key)}
+                for key, count in list(self.occupancy.items())
+            },
+            "rejected": dict(list(self.rejected.items())),
+        }
+
+    def occupancy_samples(self) -> dict:
+        return {(key,): count for key, count in list(self.occupancy.items())}
+
+    @asynccontextmanager
+    async def admit(self, scoring_job, extra: int = 0):
+        """Hold a slot for scoring_job, and yield how many of `extra` further slots were taken."""
+        key = self.key_for(scoring_job)
+        slot = self._try_acquire(key)
+        if slot is None:
+            slot = await self._wait_for_slot(key, time.monotonic() + self.hold)
+        slots = [slot]
+        while len(slots) <= extra:
+            slot = self._try_acquire(key, overflow=False)
+            if slot is None:
+                break
+            slots.append(slot)
+        try:
+            yield len(slots) - 1
+        finally:
+            for slot in slots:
+                self._release(key, slot)
+            async with self._released:
+                self._released.notify_all()
+
+    async def _wait_for_slot(self, key: str, deadline: float) -> str:
+        async with self._released:
+            while True:
+                slot = self._try_acquire(key)
+                if slot is not None:
+                    return slot
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.rejected[key] = self.rejected.get(key, 0) + 1
+                    raise BulkheadFull(f"Bulkhead full for {self.key} {key}")
+                try:
+                    await asyncio.wait_for(self._released.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _try_acquire(self, key: str, overflow: bool = True):
+        in_flight = self.occupancy.get(key, 0)
+        if in_flight < self.limit_for(key):
+            slot = "dedicated"
+        elif overflow and self.overflow_in_use < self.overflow:
+            slot = "overflow"
+            self.overflow_in_use += 1
+        else:
+            return None
+        self.occupancy[key] = in_flight + 1
+        return slot
+
+    def _release(self, key: str, slot: str):
+        if slot == "overflow":
+            self.overflow_in_use -= 1
+        remaining = self.occupancy.get(key, 1) - 1
+        if remaining > 0:
+            self.occupancy[key] = remaining
+        else:
+            self.occupancy.pop(key, None)
+
+
+class ResponsePublisher:
+    """Publishes responses on dedicated confirm-mode channels and settles request
+    deliveries on the channel they arrived on.
+
+    Publishes are spread round-robin over `channels`, none of which consumes, so a
+    slow confirm or flow-controlled publish never queues behind (or in front of)
+    deliveries and acks.
+
+    inline: publish the response, wait for its confirm, then ack the request.
+
+    pipelined: the publish is handed to a background task and the handler returns
+    immediately, with at most `window` confirms outstanding. Requests are acked only
+    after their response is confirmed, in delivery order: the longest run of
+    confirmed deliveries at the head of the channel is acked with a single
+    basic.ack(multiple=True). A response that is not confirmed requeues its request.
+    """
+
+    def __init__(self, channels: list, routing_key: str, pipelined: bool, window: int, ack_interval: float):
+        self.channels = list(channels)
+        self._channel_cycle = itertools.cycle(self.channels)
+        self.routing_key = routing_key
+        self.pipelined = pipelined
+        self.ack_interval = ack_interval
+        self.published = 0
+        self.confirm_failures = 0
+        self.acked = 0
+        self.ack_batches = 0
+        self.pending = 0
+        self._window = asyncio.Semaphore(max(1, window))
+        self._outstanding = OrderedDict()
+        self._confirmed = set()
+        self._tasks = set()
+        self._flush_task = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": "pipelined" if self.pipelined else "inline",
+            "channels": len(self.channels),
+            "published": self.published,
+            "confirm_failures": self.confirm_failures,
+            "acked": self.acked,
+            "ack_batches": self.ack_batches,
+            "confirms_pending": self.pending,
+            "unacked": len(self._outstanding),
+        }
+
+    def track(self, message):
+        """Register a delivery as soon as it arrives so acks follow delivery order."""
+        if self.pipelined:
+            self._outstanding[message.delivery_tag] = message
+
+    async def publish(self, message, response_message, routing_key: str = None):
+        """Publish response_message (to the response queue unless routing_key is given)
+        and settle the request once it is confirmed."""
+        routing_key = routing_key or self.routing_key
+        if not self.pipelined:
+            started = time.monotonic()
+            channel = next(self._channel_cycle)
+            self.pending += 1
+            try:
+                await channel.default_exchange.publish(response_message, routing_key=routing_key)
+            finally:
+                self.pending -= 1
+            STAGE_SECONDS.observe(time.monotonic() - started, "publish")
+            self.published += 1
+            await message.ack()
+            self.acked += 1
+            return
+        waited = time.monotonic()
+        await self._window.acquire()
+        PUBLISH_WINDOW_WAIT_SECONDS.observe(time.monotonic() - waited)
+        task = asyncio.create_task(self._confirm(message, response_message, routing_key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def send(self, outgoing, routing_key: str):
+        """Publish outgoing and wait for its confirm without settling any request."""
+        channel = next(self._channel_cycle)
+        self.pending += 1
+        try:
+            await channel.default_exchange.publish(outgoing, routing_key=routing_key)
+        finally:
+            self.pending -= 1
+        self.published += 1
+
+    async def reject(self, message, requeue: bool = False):
+        try:
+            await message.reject(requeue=requeue)
+        finally:
+            self._forget(message.delivery_tag)
+
+    async def nack(self, message, requeue: bool = True):
+        try:
+            await message.nack(requeue=requeue)
+        finally:
+            self._forget(message.delivery_tag)
+
+    async def close(self):
+        """Wait for outstanding confirms and ack everything that was confirmed."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._flush()
+
+    def abandon(self):
+        """Drop all state after the channel died; unsettled requests are redelivered."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._outstanding.clear()
+        self._confirmed.clear()
+
+    def _forget(self, delivery_tag):
+        if self._outstanding.pop(delivery_tag, None) is not None:
+            self._confirmed.discard(delivery_tag)
+            self._schedule_flush()
+
+    async def _confirm(self, message, response_message, routing_key: str):
+        channel = next(self._channel_cycle)
+        started = time.monotonic()
+        self.pending += 1
+        try:
+            await channel.default_exchange.publish(response_message, routing_key=routing_key)
+            STAGE_SECONDS.observe(time.monotonic() - started, "publish")
+        except Exception:
+            self.confirm_failures += 1
+            logging.error(
+                "Response was not confirmed, requeueing request",
+                extra={"delivery_tag": message.delivery_tag},
+                exc_info=True,
+            )
+            try:
+                await self.nack(message, requeue=True)
+            except Exception:
+                logging.error("Failed to requeue message")
+            return
+        finally:
+            self.pending -= 1
+            self._window.release()
+        self.published += 1
+        self._confirmed.add(message.delivery_tag)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_task is None and self._outstanding:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.ack_interval)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        last = None
+        count = 0
+        while self._outstanding:
+            tag, message = next(iter(self._outstanding.items()))
+            if tag not in self._confirmed:
+                break
+            self._outstanding.popitem(last=False)
+            self._confirmed.discard(tag)
+            last = message
+            count += 1
+        if last is None:
+            return
+        try:
+            await last.ack(multiple=True)
+            self.acked += count
+            self.ack_batches += 1
+        except Exception:
+            logging.error("Failed to ack confirmed messages", extra={"count": count}, exc_info=True)
+
+
 class RabbitMQConsumer:
     """Manages the RabbitMQ connection lifecycle and message consumption loop."""
 
@@ -309,71 +2769,450 @@ class RabbitMQConsumer:
         self.request_queue_name = os.environ['PLEXUS_RABBITMQ_REQUEST_QUEUE']
         self.response_queue_name = os.environ['PLEXUS_RABBITMQ_RESPONSE_QUEUE']
         self.prefetch = int(os.environ.get('PLEXUS_RABBITMQ_PREFETCH', DEFAULT_PREFETCH))
+        self.max_priority = int(os.environ.get('PLEXUS_RABBITMQ_MAX_PRIORITY', DEFAULT_MAX_PRIORITY))
+        self.prefetch_mode = os.environ.get('PLEXUS_RABBITMQ_PREFETCH_MODE', DEFAULT_PREFETCH_MODE).lower()
+        self.publish_mode = os.environ.get('PLEXUS_RABBITMQ_PUBLISH_MODE', DEFAULT_PUBLISH_MODE).lower()
+        self.confirm_window = int(os.environ.get('PLEXUS_RABBITMQ_CONFIRM_WINDOW', DEFAULT_CONFIRM_WINDOW))
+        self.ack_interval = float(os.environ.get('PLEXUS_RABBITMQ_ACK_BATCH_MS', DEFAULT_ACK_BATCH_MS)) / 1000
+        self.publish_channels = max(1, int(os.environ.get(
+            'PLEXUS_RABBITMQ_PUBLISH_CHANNELS', DEFAULT_PUBLISH_CHANNELS
+        )))
+        self.publisher = None
         self.health_state = health_state
         self.processor = RabbitMQJobProcessor()
+        health_state.stats_providers["scorecard_cache"] = self.processor.scorecard_cache.stats
+        health_state.stats_providers["lookup_cache"] = self.processor.lookup_cache.stats
+        health_state.stats_providers["scoring_job_loader"] = self.processor.scoring_job_loader.stats
+        health_state.stats_providers["item_loader"] = self.processor.item_loader.stats
+        health_state.stats_providers["request_logs"] = self.processor.request_logs.stats
+        if self.processor.result_cache is not None:
+            health_state.stats_providers["result_cache"] = self.processor.result_cache.stats
+        if self.processor.status_writer is not None:
+            health_state.stats_providers["status_writer"] = self.processor.status_writer.stats
+        health_state.stats_providers["publisher"] = (
+            lambda: self.publisher.stats() if self.publisher is not None else {}
+        )
+        self.in_flight = 0
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.recycle = RecyclePolicy(
+            max_jobs=int(os.environ.get('PLEXUS_MAX_JOBS', DEFAULT_MAX_JOBS)),
+            max_rss_bytes=int(float(os.environ.get('PLEXUS_MAX_RSS_MB', DEFAULT_MAX_RSS_MB)) * 2**20),
+        )
+        self.recycle_reason = None
+        self.recycle_requested = asyncio.Event()
+        self.drain_timeout = float(os.environ.get(
+            'PLEXUS_SHUTDOWN_DRAIN_SECONDS', DEFAULT_SHUTDOWN_DRAIN_SECONDS
+        ))
+        self.backoff = ReconnectBackoff(
+            base_delay=float(os.environ.get(
+                'PLEXUS_RECONNECT_BASE_DELAY_MS', DEFAULT_RECONNECT_BASE_DELAY_MS
+            )) / 1000,
+            max_delay=float(os.environ.get('PLEXUS_RECONNECT_MAX_DELAY_MS', DEFAULT_RECONNECT_MAX_DELAY_MS)) / 1000,
+        )
+        health_state.stats_providers["connection"] = self.backoff.stats
+        health_state.stats_providers["memory"] = self.recycle.stats
+        METRICS.gauge("scoring_worker_rss_bytes", "Resident set size after the last job.", lambda: self.recycle.rss_bytes)
+        self.concurrency = None
+        self.bulkheads = None
+        self.retry_policy = None
+        retry_max_attempts = int(os.environ.get('PLEXUS_RETRY_MAX_ATTEMPTS', DEFAULT_RETRY_MAX_ATTEMPTS))
+        if retry_max_attempts > 0:
+            self.retry_policy = RetryPolicy(
+                self.request_queue_name,
+                max_attempts=retry_max_attempts,
+                base_delay=float(os.environ.get(
+                    'PLEXUS_RETRY_BASE_DELAY_MS', DEFAULT_RETRY_BASE_DELAY_MS
+                )) / 1000,
+                max_delay=float(os.environ.get('PLEXUS_RETRY_MAX_DELAY_MS', DEFAULT_RETRY_MAX_DELAY_MS)) / 1000,
+            )
+            health_state.stats_providers["retries"] = self.retry_policy.stats
+        METRICS.gauge("scoring_worker_in_flight_jobs", "Jobs currently being handled.", lambda: self.in_flight)
+        METRICS.gauge(
+            "scoring_worker_publish_confirms_pending",
+            "Response publishes waiting for a broker confirm.",
+            lambda: self.publisher.pending if self.publisher is not None else 0,
+        )
+        METRICS.gauge("scoring_worker_prefetch", "Current prefetch (in-flight limit).", lambda: self.prefetch)
+        METRICS.gauge(
+            "scoring_worker_prefetch_utilization",
+            "In-flight jobs as a fraction of prefetch.",
+            lambda: self.in_flight / self.prefetch if self.prefetch else 0.0,
+        )
+        if self.prefetch_mode == 'adaptive':
+            self.concurrency = AdaptiveConcurrencyController(
+                initial=self.prefetch,
+                minimum=int(os.environ.get('PLEXUS_RABBITMQ_PREFETCH_MIN', DEFAULT_PREFETCH_MIN)),
+                maximum=int(os.environ.get('PLEXUS_RABBITMQ_PREFETCH_MAX', DEFAULT_PREFETCH_MAX)),
+                interval=float(os.environ.get(
+                    'PLEXUS_ADAPTIVE_INTERVAL_SECONDS', DEFAULT_ADAPTIVE_INTERVAL_SECONDS
+                )),
+            )
+            self.prefetch = self.concurrency.limit
+            logging.info(
+                "Adaptive prefetch enabled",
+                extra={
+                    "prefetch": self.prefetch,
+                    "prefetch_min": self.concurrency.minimum,
+                    "prefetch_max": self.concurrency.maximum,
+                },
+            )
+        self.processor.configure_concurrency(self.max_prefetch)
+        bulkhead_limit = int(os.environ.get('PLEXUS_BULKHEAD_LIMIT', DEFAULT_BULKHEAD_LIMIT))
+        bulkhead_limits = Bulkheads.parse_limits(os.environ.get('PLEXUS_BULKHEAD_LIMITS', ''))
+        if bulkhead_limit > 0 or bulkhead_limits:
+            self.bulkheads = Bulkheads(
+                default_limit=bulkhead_limit or self.max_prefetch,
+                limits=bulkhead_limits,
+                overflow=int(os.environ.get('PLEXUS_BULKHEAD_OVERFLOW', DEFAULT_BULKHEAD_OVERFLOW)),
+                hold=float(os.environ.get('PLEXUS_BULKHEAD_HOLD_MS', DEFAULT_BULKHEAD_HOLD_MS)) / 1000,
+                key=os.environ.get('PLEXUS_BULKHEAD_KEY', DEFAULT_BULKHEAD_KEY).lower(),
+            )
+            self.requeue_delay = float(os.environ.get(
+                'PLEXUS_BULKHEAD_REQUEUE_DELAY_MS', DEFAULT_BULKHEAD_REQUEUE_DELAY_MS
+            )) / 1000
+            self.deferred_queue_name = f"{self.request_queue_name}.deferred"
+            health_state.stats_providers["bulkheads"] = self.bulkheads.stats
+            METRICS.gauge(
+                "scoring_worker_bulkhead_in_flight",
+                "In-flight jobs per bulkhead key.",
+                self.bulkheads.occupancy_samples,
+                ("key",),
+            )
+            METRICS.gauge(
+                "scoring_worker_bulkhead_overflow_in_use",
+                "Shared overflow slots in use.",
+                lambda: self.bulkheads.overflow_in_use,
+            )
+
+    @property
+    def max_prefetch(self) -> int:
+        return self.concurrency.maximum if self.concurrency is not None else self.prefetch
+
+    def _request_queue_arguments(self):
+        # x-max-priority is fixed when a queue is created; redeclaring an existing
+        # queue with different arguments fails, so the queue must be recreated.
+        if self.max_priority <= 0:
+            return None
+        return {"x-max-priority": self.max_priority}
 
     async def run(self, shutdown: asyncio.Event):
+        # The processor (clients, caches, warm scorecards) is built once and survives
+        # reconnects; only the connection, channel, queues and consumer are redone.
         await self.processor.initialize()
+        self.health_state.warmed_up = True
 
         monitor_task = None
         while not shutdown.is_set():
+            connection = None
             try:
-                connection = await aio_pika.connect_robust(self.rabbitmq_url)
-                channel = await connection.channel(publisher_confirms=True)
-                await channel.set_qos(prefetch_count=self.prefetch)
-
-                request_queue = await channel.declare_queue(self.request_queue_name, durable=True)
+                connection = await aio_pika.connect(self.rabbitmq_url)
+                # The consumer channel only receives deliveries and settles them;
+                # responses go out on their own confirm-mode channels.
+                channel = await connection.channel(publisher_confirms=False)
+                publish_channels = [
+                    await connection.channel(publisher_confirms=True) for _ in range(self.publish_channels)
+                ]
+                # A per-consumer basic.qos only applies to consumers started after it,
+                # so adaptive mode sets a channel-wide limit that it can change live.
+                await channel.set_qos(prefetch_count=self.prefetch, global_=self.concurrency is not None)
+
+                request_queue = await channel.declare_queue(
+                    self.request_queue_name, durable=True, arguments=self._request_queue_arguments()
+                )
                 response_queue = await channel.declare_queue(self.response_queue_name, durable=True)
+                if self.retry_policy is not None:
+                    await self.retry_policy.declare(channel)
+                if self.bulkheads is not None and self.requeue_delay > 0:
+                    await channel.declare_queue(
+                        self.deferred_queue_name,
+                        durable=True,
+                        arguments={
+                            "x-message-ttl": int(self.requeue_delay * 1000),
+                            "x-dead-letter-exchange": "",
+                            "x-dead-letter-routing-key": self.request_queue_name,
+                        },
+                    )
+                self.publisher = ResponsePublisher(
+                    publish_channels,
+                    response_queue.name,
+                    pipelined=self.publish_mode == 'pipelined',
+                    window=self.confirm_window,
+                    ack_interval=self.ack_interval,
+                )
 
-                self.health_state.ready = True
+                self.health_state.connected = True
                 logging.info("Connected to RabbitMQ and declared queues")
 
                 monitor_task = asyncio.create_task(
-                    self._monitor_connection(connection, channel, shutdown)
+                    self._monitor_connection(connection, [channel, *publish_channels], shutdown)
                 )
 
+                publisher = self.publisher
                 consumer_tag = await request_queue.consume(
-                    lambda msg: self._on_message(msg, channel, response_queue)
+                    lambda msg: self._on_message(msg, publisher, channel)
                 )
+                outage = self.backoff.connected()
+                if outage is not None:
+                    logging.info(
+                        "Reconnected to RabbitMQ",
+                        extra={"outage_seconds": round(outage, 3), "reconnects": self.backoff.reconnects},
+                    )
                 logging.info("RabbitMQ consumer started")
 
-                await shutdown.wait()
+                stop_reason = await self._wait_for_stop(shutdown, monitor_task)
+                if stop_reason == "connection_lost":
+                    raise ConnectionError("RabbitMQ connection lost")
+                self.health_state.draining = True
                 await request_queue.cancel(consumer_tag)
+                await self._drain()
+                await publisher.close()
+                for publish_channel in publish_channels:
+                    await publish_channel.close()
                 await channel.close()
                 await connection.close()
-                self.health_state.ready = False
+                self.health_state.connected = False
                 monitor_task.cancel()
+                if stop_reason == "recycle":
+                    break
 
             except Exception as e:
                 if monitor_task is not None and not monitor_task.done():
                     monitor_task.cancel()
-                self.health_state.ready = False
-                logging.error(f"RabbitMQ connection error: {e}")
+                self.health_state.connected = False
+                self.backoff.disconnected()
+                if self.publisher is not None:
+                    self.publisher.abandon()
+                if connection is not None and not connection.is_closed:
+                    try:
+                        await connection.close()
+                    except Exception:
+                        pass
+                if self.recycle_reason is not None:
+                    break
+                delay = self.backoff.next_delay()
+                logging.error(
+                    f"RabbitMQ connection error: {e}",
+                    extra={"attempt": self.backoff.attempt, "retry_in_seconds": round(delay, 3)},
+                )
                 logging.error(traceback.format_exc())
-                await asyncio.sleep(5)
+                try:
+                    await asyncio.wait_for(shutdown.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+        await self.processor.close()
+
+    async def _wait_for_stop(self, shutdown: asyncio.Event, monitor_task=None) -> str:
+        waiters = {
+            asyncio.ensure_future(shutdown.wait()): "shutdown",
+            asyncio.ensure_future(self.recycle_requested.wait()): "recycle",
+        }
+        if monitor_task is not None:
+            waiters[monitor_task] = "connection_lost"
+        done, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            if waiter is not monitor_task:
+                waiter.cancel()
+        return "shutdown" if shutdown.is_set() else waiters[next(iter(done))]
+
+    async def _drain(self):
+        """Wait up to drain_timeout for in-flight jobs once the consumer is cancelled.
+
+        Jobs still running at the deadline lose their channel when it closes; their
+        requests are unacked, so the broker redelivers them to another worker.
+        """
+        deadline = time.monotonic() + self.drain_timeout
+        self.health_state.drain_progress = lambda: {
+            "in_flight": self.in_flight,
+            "drain_remaining_seconds": round(max(0.0, deadline - time.monotonic()), 1),
+        }
+        started = time.monotonic()
+        logging.info(
+            "Draining in-flight jobs",
+            extra={"in_flight": self.in_flight, "drain_timeout_seconds": self.drain_timeout},
+        )
+        try:
+            await asyncio.wait_for(self.idle.wait(), timeout=self.drain_timeout)
+            logging.info("Drain complete", extra={"duration_seconds": round(time.monotonic() - started, 3)})
+        except asyncio.TimeoutError:
+            logging.warning(
+                "Drain deadline reached, closing with jobs in flight",
+                extra={"in_flight": self.in_flight},
+            )
 
-    async def _monitor_connection(self, connection, channel, shutdown: asyncio.Event):
+    def _request_recycle(self, reason: str):
+        if self.recycle_reason is not None:
+            return
+        self.recycle_reason = reason
+        self.health_state.draining = True
+        logging.info("Recycling worker", extra={"reason": reason, **self.recycle.stats()})
+        self.recycle_requested.set()
+
+    async def _monitor_connection(self, connection, channels: list, shutdown: asyncio.Event):
         while not shutdown.is_set():
-            if connection.is_closed or channel.is_closed:
-                self.health_state.ready = False
+            if connection.is_closed or any(channel.is_closed for channel in channels):
+                self.health_state.connected = False
                 return
             await asyncio.sleep(1)
 
-    async def _on_message(self, message: aio_pika.IncomingMessage, channel, response_queue):
+    async def _on_message(self, message: aio_pika.IncomingMessage, publisher: ResponsePublisher, channel):
+        publisher.track(message)
+        self.in_flight += 1
+        self.idle.clear()
+        started = time.monotonic()
+        rss_before = _current_rss_bytes() if self.recycle.enabled else 0
+        ok = False
+        try:
+            ok = await self._handle_message(message, publisher)
+        finally:
+            in_flight = self.in_flight
+            self.in_flight -= 1
+            if ok is not None:
+                JOB_SECONDS.observe(time.monotonic() - started)
+                if self.recycle.enabled:
+                    reason = self.recycle.record_job(rss_before)
+                    if reason is not None:
+                        self._request_recycle(reason)
+                await self._record_completion(time.monotonic() - started, ok, in_flight, channel)
+            if self.in_flight == 0:
+                self.idle.set()
+
+    async def _record_completion(self, latency: float, ok: bool, in_flight: int, channel):
+        if self.concurrency is None:
+            return
+        new_limit = self.concurrency.record(latency, ok, in_flight)
+        if new_limit is None:
+            return
+        try:
+            await channel.set_qos(prefetch_count=new_limit, global_=True)
+            self.prefetch = new_limit
+        except Exception:
+            logging.error("Failed to apply adaptive prefetch", extra={"prefetch": new_limit}, exc_info=True)
+
+    def _response_message(self, message: aio_pika.IncomingMessage, response: dict) -> aio_pika.Message:
+        """Encode a response with the codec of the request it answers."""
+        codec = codec_for(message.content_type)
+        return aio_pika.Message(
+            body=codec.encode(response),
+            content_type=codec.content_type,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            priority=message.priority,
+        )
+
+    async def _handle_batch(self, message, publisher: ResponsePublisher, request_id: str, scoring_job_ids: list):
+        """Score a batch request and publish one combined response with per-job results.
+
+        With retries enabled, jobs that fail transiently are sent through the retry tiers
+        as a batch request of their own and reported as "retried"; their results come in
+        a later response with the same request_id. Once the attempts are used up they
+        are reported as errors.
+        """
+        policy = self.retry_policy
+        attempt = int((message.headers or {}).get(RETRY_ATTEMPT_HEADER, 0)) + 1
+        can_retry = policy is not None and attempt <= policy.max_attempts
+        results = await self.processor.process_scoring_jobs(
+            scoring_job_ids,
+            request_id,
+            admission=self.bulkheads.admit if self.bulkheads is not None else None,
+            retryable=is_retryable if can_retry else None,
+        )
+        retry_ids = [result["scoring_job_id"] for result in results if result["status"] == "retried"]
+        if retry_ids and not await self._retry_batch_jobs(message, publisher, request_id, retry_ids, attempt):
+            for result in results:
+                if result["status"] == "retried":
+                    result["status"] = "error"
+            retry_ids = []
+        failed = sum(1 for result in results if result["status"] == "error")
+        BATCH_ITEMS_TOTAL.inc("success", amount=len(results) - failed - len(retry_ids))
+        BATCH_ITEMS_TOTAL.inc("error", amount=failed)
+        BATCH_ITEMS_TOTAL.inc("retried", amount=len(retry_ids))
+        if not failed and not retry_ids:
+            status = outcome = "success"
+        elif failed < len(results):
+            status = outcome = "partial"
+        else:
+            status, outcome = "error", "failed"
+
+        response = {"request_id": request_id, "status": status, "results": results}
+        await publisher.publish(message, self._response_message(message, response))
+        logging.info(
+            "Processed batch message",
+            extra={"request_id": request_id, "jobs": len(results), "failed": failed, "retried": len(retry_ids)},
+        )
+        MESSAGES_TOTAL.inc(outcome)
+        return failed < len(results)
+
+    async def _retry_batch_jobs(self, message, publisher: ResponsePublisher, request_id, scoring_job_ids: list,
+                                attempt: int) -> bool:
+        """Publish a batch's transiently failed jobs to the retry tier for attempt, as a
+        batch request of their own. Returns False if that publish failed."""
+        policy = self.retry_policy
+        codec = codec_for(message.content_type)
+        expiration = policy.delay(attempt)
+        retry_message = aio_pika.Message(
+            body=codec.encode({"request_id": request_id, "scoring_job_ids": scoring_job_ids}),
+            headers={**(message.headers or {}), RETRY_ATTEMPT_HEADER: attempt},
+            content_type=codec.content_type,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            priority=message.priority,
+            correlation_id=message.correlation_id,
+            expiration=expiration,
+        )
+        try:
+            await publisher.send(retry_message, policy.tier_queue(attempt))
+        except Exception:
+            logging.error(
+                "Failed to schedule retry of batch jobs, reporting them as failed",
+                extra={"request_id": request_id, "jobs": len(scoring_job_ids)},
+                exc_info=True,
+            )
+            return False
+        policy.retried += 1
+        logging.warning(
+            "Scheduled retry of batch jobs",
+            extra={
+                "request_id": request_id,
+                "attempt": attempt,
+                "jobs": len(scoring_job_ids),
+                "delay_seconds": round(expiration, 3),
+            },
+        )
+        return True
+
+    async def _handle_message(self, message: aio_pika.IncomingMessage, publisher: ResponsePublisher):
+        """Process one delivery. Returns True/False for job success, None for invalid or requeued messages."""
         request_id = None
+        MESSAGES_BY_PRIORITY.inc(str(message.priority or 0))
         try:
-            payload = json.loads(message.body.decode())
+            payload = codec_for(message.content_type).decode(message.body)
             request_id = payload.get("request_id")
             scoring_job_id = payload.get("scoring_job_id")
-            if not request_id or not scoring_job_id:
+            scoring_job_ids = payload.get("scoring_job_ids")
+            if scoring_job_ids is not None and not (
+                isinstance(scoring_job_ids, list)
+                and scoring_job_ids
+                and all(isinstance(id_, str) and id_ for id_ in scoring_job_ids)
+            ):
+                scoring_job_ids = None
+                scoring_job_id = None
+            if not request_id or not (scoring_job_id or scoring_job_ids):
                 logging.error(
-                    "Invalid message (missing request_id or scoring_job_id)",
+                    "Invalid message (missing request_id or scoring_job_id/scoring_job_ids)",
                     extra={"payload": payload},
                 )
-                await message.reject(requeue=False)
-                return
+                MESSAGES_TOTAL.inc("invalid")
+                await publisher.reject(message, requeue=False)
+                return None
+
+            if scoring_job_ids is not None:
+                return await self._handle_batch(message, publisher, request_id, scoring_job_ids)
 
-            result_payload = await self.processor.process_scoring_job(scoring_job_id, request_id)
+            result_payload = await self.processor.process_scoring_job(
+                scoring_job_id,
+                request_id,
+                admission=self.bulkheads.admit if self.bulkheads is not None else None,
+            )
 
             response = {
                 "request_id": request_id,
@@ -381,20 +3220,27 @@ class RabbitMQConsumer:
                 "value": result_payload.get("value"),
                 "explanation": result_payload.get("explanation"),
                 "cost": result_payload.get("cost"),
+                "cached": result_payload.get("cached", False),
             }
-            response_message = aio_pika.Message(
-                body=json.dumps(response).encode(),
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            )
-            await channel.default_exchange.publish(
-                response_message,
-                routing_key=response_queue.name,
-            )
-            await message.ack()
+            await publisher.publish(message, self._response_message(message, response))
             logging.info(
                 "Processed message",
                 extra={"request_id": request_id, "scoring_job_id": scoring_job_id},
             )
+            MESSAGES_TOTAL.inc("success")
+            return True
+
+        except BulkheadFull as e:
+            # A nack would put the request back at the head of the queue, where it is
+            # redelivered at once ahead of the jobs it is meant to let through.
+            logging.info(
+                "Bulkhead full, requeueing message",
+                extra={"request_id": request_id, "reason": str(e)},
+            )
+            MESSAGES_TOTAL.inc("requeued")
+            routing_key = self.deferred_queue_name if self.requeue_delay > 0 else self.request_queue_name
+            await self._forward(message, publisher, request_id, routing_key, dict(message.headers or {}))
+            return None
 
         except Exception as e:
             logging.error(
@@ -402,10 +3248,90 @@ class RabbitMQConsumer:
                 extra={"request_id": request_id},
                 exc_info=True,
             )
+            if self.retry_policy is not None:
+                await self._retry_or_park(message, publisher, request_id, e)
+                return False
+            MESSAGES_TOTAL.inc("rejected")
             try:
-                await message.reject(requeue=False)
+                await publisher.reject(message, requeue=False)
             except Exception:
                 logging.error("Failed to reject message")
+            return False
+
+    async def _forward(self, message, publisher: ResponsePublisher, request_id, routing_key: str,
+                       headers: dict, expiration=None) -> bool:
+        """Publish a copy of a request to routing_key and ack the original once the copy is
+        confirmed. If the copy cannot be published the original is requeued and False is
+        returned."""
+        forwarded = aio_pika.Message(
+            body=message.body,
+            headers=headers,
+            content_type=message.content_type,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            priority=message.priority,
+            correlation_id=message.correlation_id,
+            message_id=message.message_id,
+            expiration=expiration,
+        )
+        try:
+            await publisher.publish(message, forwarded, routing_key=routing_key)
+        except Exception:
+            logging.error(
+                "Failed to forward message, requeueing it",
+                extra={"request_id": request_id, "routing_key": routing_key},
+            )
+            try:
+                await publisher.nack(message, requeue=True)
+            except Exception:
+                logging.error("Failed to requeue message")
+            return False
+        return True
+
+    async def _retry_or_park(self, message, publisher: ResponsePublisher, request_id, error: Exception):
+        """Send a failed request to its next retry tier, or park it if the error is fatal
+        or its attempts are used up."""
+        policy = self.retry_policy
+        headers = dict(message.headers or {})
+        attempt = int(headers.get(RETRY_ATTEMPT_HEADER, 0)) + 1
+        retryable = is_retryable(error)
+        headers[RETRY_ATTEMPT_HEADER] = attempt
+        expiration = None
+        if retryable and attempt <= policy.max_attempts:
+            routing_key = policy.tier_queue(attempt)
+            expiration = policy.delay(attempt)
+        else:
+            routing_key = policy.parking_queue
+            headers["x-parked-reason"] = "retries_exhausted" if retryable else "fatal"
+            headers["x-error-type"] = type(error).__name__
+            headers["x-error"] = str(error)[:1000]
+
+        if not await self._forward(message, publisher, request_id, routing_key, headers, expiration):
+            return
+
+        if expiration is not None:
+            policy.retried += 1
+            MESSAGES_TOTAL.inc("retried")
+            logging.warning(
+                "Scheduled retry",
+                extra={
+                    "request_id": request_id,
+                    "attempt": attempt,
+                    "delay_seconds": round(expiration, 3),
+                    "error_type": type(error).__name__,
+                },
+            )
+        else:
+            policy.parked += 1
+            MESSAGES_TOTAL.inc("parked")
+            logging.error(
+                "Parked message",
+                extra={
+                    "request_id": request_id,
+                    "attempt": attempt,
+                    "reason": headers["x-parked-reason"],
+                    "error_type": type(error).__name__,
+                },
+            )
 
 
 def validate_config():
@@ -416,11 +3342,25 @@ def validate_config():
         sys.exit(1)
 
 
-async def run():
-    configure_logging()
-    validate_config()
-    logging.info("Configuration validated")
+async def _report_health(conn, state: HealthState, stopped: asyncio.Event):
+    """Send this child's health snapshot to the supervisor until the consumer stops,
+    so the parent sees the drain through to the end."""
+    while not stopped.is_set():
+        try:
+            conn.send(state.snapshot())
+        except (BrokenPipeError, OSError):
+            return
+        try:
+            await asyncio.wait_for(stopped.wait(), timeout=CHILD_HEALTH_REPORT_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
 
+
+async def run(health_conn=None):
+    """Run one consumer. Supervised children pass health_conn instead of serving HTTP.
+
+    Returns the recycle reason if the worker stopped itself to release memory.
+    """
     shutdown = asyncio.Event()
 
     def handle_signal(*_):
@@ -433,14 +3373,222 @@ async def run():
     logging.info("Worker started")
 
     health_state = HealthState()
-    health_server = start_health_server(health_state)
+    lag_monitor = LoopLagMonitor(
+        float(os.environ.get('PLEXUS_LOOP_LAG_INTERVAL_MS', DEFAULT_LOOP_LAG_INTERVAL_MS)) / 1000
+    )
+    health_state.loop_lag = lag_monitor
+    health_state.max_loop_lag = float(os.environ.get(
+        'PLEXUS_HEALTH_MAX_LOOP_LAG_MS', DEFAULT_HEALTH_MAX_LOOP_LAG_MS
+    )) / 1000
+    health_state.stats_providers["event_loop"] = lag_monitor.stats
+    METRICS.gauge(
+        "scoring_worker_event_loop_lag_seconds",
+        "Event-loop scheduling delay measured by the lag probe.",
+        lag_monitor.current_lag,
+    )
+    lag_task = asyncio.create_task(lag_monitor.run(shutdown))
+
+    health_server = None
+    report_task = None
+    stopped = asyncio.Event()
+    if health_conn is None:
+        health_server = start_health_server(health_state)
+    else:
+        report_task = asyncio.create_task(_report_health(health_conn, health_state, stopped))
 
     consumer = RabbitMQConsumer(health_state)
+    pool_size = int(os.environ.get('PLEXUS_THREAD_POOL_SIZE', 0)) or max(
+        MIN_THREAD_POOL_SIZE, THREADS_PER_IN_FLIGHT_JOB * consumer.max_prefetch
+    )
+    executor = InstrumentedThreadPoolExecutor(pool_size)
+    asyncio.get_running_loop().set_default_executor(executor)
+    health_state.stats_providers["thread_pool"] = executor.stats
+    logging.info("Thread pool configured", extra={"thread_pool_size": pool_size})
+
     await consumer.run(shutdown)
 
+    shutdown.set()
+    stopped.set()
+    lag_task.cancel()
+    if report_task is not None:
+        await report_task
+    if health_server is not None:
+        health_server.shutdown()
+    logging.info("Worker stopped", extra={"recycle_reason": consumer.recycle_reason})
+    return consumer.recycle_reason
+
+
+def preload_modules():
+    """Import heavy scoring modules up front so forked children share their pages."""
+    if os.environ.get('PLEXUS_SCORING_MODE', 'real').lower() == 'mock':
+        return
+    started = time.monotonic()
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            logging.warning(f"Failed to preload module {name}", exc_info=True)
+    try:
+        from nltk.tokenize import sent_tokenize
+        sent_tokenize("Warm up the punkt tokenizer.")
+    except Exception:
+        logging.warning("Failed to preload NLTK punkt data", exc_info=True)
+    logging.info(
+        "Preloaded modules",
+        extra={"duration_seconds": round(time.monotonic() - started, 3)},
+    )
+
+
+def _child_main(index: int, health_conn):
+    configure_logging()
+    logging.info("Worker process started", extra={"worker_index": index, "pid": os.getpid()})
+    try:
+        recycle_reason = asyncio.run(run(health_conn))
+    finally:
+        # Forked children exit without running atexit handlers
+        _stop_log_listener()
+    if recycle_reason is not None:
+        sys.exit(RECYCLE_EXIT_CODE)
+
+
+def supervise(processes: int):
+    """Fork and babysit N consumer processes; the parent owns the health server."""
+    preload_modules()
+    context = multiprocessing.get_context("fork")
+    stopping = Event()
+
+    def handle_signal(*_):
+        logging.info("Shutdown signal received, stopping worker processes")
+        health_state.draining = True
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    health_state = SupervisorHealthState()
+    health_server = start_health_server(health_state)
+    children = {}
+    started_at = {}
+    fast_failures = {}
+    restart_at = {}
+    closed = set()
+    failed = False
+
+    def spawn(index: int):
+        reader, writer = context.Pipe(duplex=False)
+        process = context.Process(target=_child_main, args=(index, writer), daemon=False)
+        process.start()
+        writer.close()
+        children[index] = (process, reader)
+        started_at[index] = time.monotonic()
+        closed.discard(index)
+        logging.info("Spawned worker process", extra={"worker_index": index, "pid": process.pid})
+
+    for index in range(processes):
+        spawn(index)
+    logging.info("Supervisor started", extra={"processes": processes})
+
+    def read_reports(timeout: float):
+        readers = {
+            reader: index for index, (_process, reader) in children.items() if index not in closed
+        }
+        for reader in wait_for_connections(list(readers), timeout=timeout):
+            try:
+                while reader.poll():
+                    health_state.update(readers[reader], reader.recv())
+            except (EOFError, OSError):
+                closed.add(readers[reader])
+
+    while not stopping.is_set():
+        read_reports(CHILD_HEALTH_REPORT_INTERVAL)
+
+        if stopping.is_set():
+            break
+        now = time.monotonic()
+        for index, (process, reader) in list(children.items()):
+            if process.is_alive():
+                continue
+            if index in restart_at:
+                if now >= restart_at[index]:
+                    del restart_at[index]
+                    spawn(index)
+                continue
+            reader.close()
+            closed.add(index)
+            health_state.forget(index)
+            if process.exitcode == RECYCLE_EXIT_CODE:
+                fast_failures[index] = 0
+                logging.info(
+                    "Worker process recycled, restarting",
+                    extra={"worker_index": index, "pid": process.pid},
+                )
+                spawn(index)
+                continue
+            if now - started_at[index] < CHILD_FAST_FAILURE_SECONDS:
+                fast_failures[index] = fast_failures.get(index, 0) + 1
+            else:
+                fast_failures[index] = 1
+            if fast_failures[index] >= CHILD_MAX_FAST_FAILURES:
+                logging.error(
+                    "Worker process keeps failing on startup, stopping supervisor",
+                    extra={
+                        "worker_index": index,
+                        "exit_code": process.exitcode,
+                        "consecutive_failures": fast_failures[index],
+                    },
+                )
+                failed = True
+                stopping.set()
+                break
+            delay = min(CHILD_RESTART_MAX_DELAY, CHILD_RESTART_BASE_DELAY * 2 ** (fast_failures[index] - 1))
+            restart_at[index] = now + delay
+            logging.error(
+                "Worker process exited, restarting",
+                extra={
+                    "worker_index": index,
+                    "pid": process.pid,
+                    "exit_code": process.exitcode,
+                    "restart_in_seconds": delay,
+                },
+            )
+
+    for process, _reader in children.values():
+        if process.is_alive():
+            process.terminate()
+    # Keep reading health reports while children drain: it keeps /readyz current and
+    # stops a full pipe from blocking a child's event loop.
+    drain_timeout = float(os.environ.get('PLEXUS_SHUTDOWN_DRAIN_SECONDS', DEFAULT_SHUTDOWN_DRAIN_SECONDS))
+    deadline = time.monotonic() + drain_timeout + CHILD_STOP_TIMEOUT
+    while time.monotonic() < deadline and any(p.is_alive() for p, _r in children.values()):
+        read_reports(min(0.5, max(0.0, deadline - time.monotonic())))
+        if len(closed) == len(children):
+            break
+    for index, (process, reader) in children.items():
+        process.join(max(0.0, deadline - time.monotonic()))
+        if process.is_alive():
+            logging.error("Worker process did not stop in time, killing", extra={"worker_index": index})
+            process.kill()
+            process.join()
+        reader.close()
+
     health_server.shutdown()
-    logging.info("Worker stopped")
+    logging.info("Supervisor stopped")
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    configure_logging()
+    validate_config()
+    logging.info("Configuration validated")
+
+    processes = int(os.environ.get('PLEXUS_WORKER_PROCESSES', DEFAULT_WORKER_PROCESSES))
+    if processes > 1:
+        supervise(processes)
+    elif asyncio.run(run()) is not None:
+        # Exit non-zero so the orchestrator starts a fresh container
+        sys.exit(RECYCLE_EXIT_CODE)
 
 
 if __name__ == '__main__':
-    asyncio.run(run())
+    main()